@@ -1,18 +1,30 @@
 """
-NARI Backend - Flask API Server (Integrated with Nova LLM)
+NARI Backend - Quart API Server (Integrated with Nova LLM)
 Provides REST API for chat with NARI's full LLM client, memory, and tools.
 """
 
+import quart_flask_patch  # noqa: F401 - must be first, enables Flask extensions under Quart
+
 import sys
 import os
 import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+
+import orjson
 
 # Add Nova project to path for imports
 NOVA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'Nova-Long-Horizon-Agentic-Ai'))
 sys.path.insert(0, NOVA_PATH)
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+from dotenv import load_dotenv
+from quart import Quart, Response, request, jsonify
+from quart_cors import cors
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import selectinload
 from werkzeug.utils import secure_filename
 from models import db, Chat, Message, UploadedFile
 
@@ -25,14 +37,30 @@ from tools import registry, execute_tool_call
 # Configuration
 UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), 'uploads')
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for frontend
+app = Quart(__name__)
+app = cors(app)  # Enable CORS for frontend
 
 # Database configuration
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///nari.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///nari.db?check_same_thread=false'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_pre_ping': True,
+}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+    """Enable WAL so history reads don't serialize behind chat-save commits."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.close()
+
 # Initialize database
 db.init_app(app)
 
@@ -44,98 +72,325 @@ config = None
 llm_client = None
 memory_service = None
 
+# Tool schemas are static for the server's lifetime; built once in init_nova()
+# with deterministic ordering so the serialized tool block stays byte-identical
+# between requests (keeps provider prompt caching effective).
+TOOLS_FOR_LLM = []
+
+
 def init_nova():
     """Initialize Nova LLM components."""
-    global config, llm_client, memory_service
-    
-    # Load config from Nova's .env
-    os.chdir(NOVA_PATH)
+    global config, llm_client, memory_service, TOOLS_FOR_LLM
+
+    # Load Nova's .env by path - the previous chdir into NOVA_PATH was a
+    # process-global side effect that raced with concurrent requests
+    load_dotenv(dotenv_path=os.path.join(NOVA_PATH, '.env'), override=True)
     config = reload_config()
-    os.chdir(os.path.dirname(__file__))
-    
+
     llm_client = get_client(config=config)
     memory_service = get_memory_service(config=config)
-    
+    TOOLS_FOR_LLM = sorted(registry.get_tools_for_llm(), key=lambda t: t.name)
+
     print(f"Nova initialized: Provider={config.default_provider.value}, Model={config.current_model}")
     print(f"Memory enabled: {memory_service.is_enabled}")
 
 
+def ojsonify(obj, status=200):
+    """jsonify via orjson - SIMD string escaping beats stdlib json on the
+    large history payloads."""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
+
 # =============================================================================
 # Chat History Endpoints
 # =============================================================================
 
 @app.route('/api/history', methods=['GET'])
-def get_history():
+async def get_history():
     """Get all chat history."""
-    chats = Chat.query.order_by(Chat.updated_at.desc()).all()
-    return jsonify([chat.to_dict() for chat in chats])
+    # Cheap change detection first: the frontend polls this endpoint, and an
+    # unchanged history costs one scalar query and an empty 304
+    max_ts, count = await asyncio.to_thread(
+        lambda: db.session.query(
+            db.func.max(Chat.updated_at), db.func.count(Chat.id)
+        ).one()
+    )
+    etag = hashlib.blake2b(f"{max_ts}|{count}".encode(), digest_size=8).hexdigest()
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304, {'ETag': etag}
+
+    chats = await asyncio.to_thread(
+        lambda: Chat.query.options(selectinload(Chat.messages))
+        .order_by(Chat.updated_at.desc())
+        .all()
+    )
+    response = ojsonify([chat.to_dict_fast() for chat in chats])
+    response.headers['ETag'] = etag
+    return response
 
 
 @app.route('/api/history', methods=['POST'])
-def save_history():
+async def save_history():
     """Save or sync chat history."""
-    data = request.get_json()
+    data = await request.get_json()
     
     if not data:
         return jsonify({'error': 'No data provided'}), 400
     
     chats_data = data if isinstance(data, list) else [data]
-    
-    saved_chats = []
-    for chat_data in chats_data:
-        chat_id = chat_data.get('id')
-        
-        if chat_id:
-            chat = Chat.query.get(chat_id)
-            if not chat:
-                chat = Chat(id=chat_id, title=chat_data.get('title', 'New Chat'))
+
+    # All ORM work runs off the event loop; a slow commit must not stall
+    # every other in-flight request
+    def sync_chats():
+        saved_chats = []
+        pending_messages = []  # (chat, messages_data) - chat IDs assigned after flush
+
+        for chat_data in chats_data:
+            chat_id = chat_data.get('id')
+
+            if chat_id:
+                chat = Chat.query.get(chat_id)
+                if not chat:
+                    chat = Chat(id=chat_id, title=chat_data.get('title', 'New Chat'))
+                    db.session.add(chat)
+            else:
+                chat = Chat(title=chat_data.get('title', 'New Chat'))
                 db.session.add(chat)
-        else:
-            chat = Chat(title=chat_data.get('title', 'New Chat'))
-            db.session.add(chat)
-        
-        chat.title = chat_data.get('title', chat.title)
-        
-        # Handle messages
-        messages_data = chat_data.get('messages', [])
-        Message.query.filter_by(chat_id=chat.id).delete()
-        
-        for msg_data in messages_data:
-            msg = Message(
-                chat_id=chat.id,
-                role=msg_data.get('role', 'user'),
-                content=msg_data.get('content', '')
+
+            chat.title = chat_data.get('title', chat.title)
+
+            pending_messages.append((chat, chat_data.get('messages', [])))
+            saved_chats.append(chat)
+
+        # Assign IDs to any new chats so message rows can reference them
+        db.session.flush()
+
+        # One batched DELETE for all synced chats, then one multi-row INSERT,
+        # instead of a DELETE per chat and an INSERT per message
+        chat_ids = [chat.id for chat in saved_chats]
+        if chat_ids:
+            db.session.execute(
+                Message.__table__.delete().where(Message.chat_id.in_(chat_ids))
             )
-            db.session.add(msg)
-        
-        saved_chats.append(chat)
-    
-    db.session.commit()
-    return jsonify([chat.to_dict() for chat in saved_chats])
+
+        msg_rows = [
+            {
+                'chat_id': chat.id,
+                'role': msg_data.get('role', 'user'),
+                'content': msg_data.get('content', ''),
+            }
+            for chat, messages_data in pending_messages
+            for msg_data in messages_data
+        ]
+        if msg_rows:
+            db.session.bulk_insert_mappings(Message, msg_rows)
+
+        db.session.commit()
+        return [chat.to_dict() for chat in saved_chats]
+
+    return jsonify(await asyncio.to_thread(sync_chats))
 
 
 @app.route('/api/history/<int:chat_id>', methods=['DELETE'])
-def delete_chat(chat_id):
+async def delete_chat(chat_id):
     """Delete a specific chat."""
-    chat = Chat.query.get(chat_id)
-    
-    if not chat:
+    def delete_sync():
+        chat = Chat.query.get(chat_id)
+        if not chat:
+            return False
+        db.session.delete(chat)
+        db.session.commit()
+        return True
+
+    if not await asyncio.to_thread(delete_sync):
         return jsonify({'error': 'Chat not found'}), 404
-    
-    db.session.delete(chat)
-    db.session.commit()
-    
+
     return jsonify({'success': True, 'deleted_id': chat_id})
 
 
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+class ResponseCache:
+    """
+    Small TTL'd LRU cache for chat responses.
+
+    Keys are a digest of the normalized user text plus the conversation tail,
+    so a repeated question skips the upstream LLM round-trip entirely.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def make_key(user_text, chat_id, history_tail):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(" ".join(user_text.lower().split()).encode())
+        h.update(str(chat_id).encode())
+        for content in history_tail:
+            h.update(content.encode())
+        return h.hexdigest()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expiry = entry
+        if time.time() > expiry:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = (value, time.time() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+response_cache = ResponseCache()
+
+
+# =============================================================================
+# Memory Pack
+# =============================================================================
+
+# Versioned per-user memory packs: a deterministic, ID-sorted memory block
+# whose bytes only change when the underlying memories do, so the provider's
+# prompt cache keeps hitting on the memory section across requests.
+MEMORY_PACK_TTL = 60.0
+_memory_packs = {}  # user_id -> (text, version, expiry, memories)
+
+
+def build_memory_pack(user_id):
+    """Return (text, version) for the user's memory block, cached for a short TTL."""
+    cached = _memory_packs.get(user_id)
+    if cached and time.time() < cached[2]:
+        return cached[0], cached[1]
+
+    memories = memory_service.get_all(user_id=user_id, limit=50)
+    memories.sort(key=lambda m: m.id)
+    text = "\n".join(f"- {m.content}" for m in memories)
+    version = hashlib.md5(text.encode()).hexdigest()
+    _memory_packs[user_id] = (text, version, time.time() + MEMORY_PACK_TTL, memories)
+    return text, version
+
+
+def invalidate_memory_pack(user_id):
+    """Drop the cached pack after the user's memory store changes."""
+    _memory_packs.pop(user_id, None)
+
+
+def store_exchange(user_text, assistant_response):
+    """Persist an exchange to memory and invalidate the user's memory pack."""
+    memory_service.extract_and_store(
+        user_input=user_text,
+        assistant_response=assistant_response,
+        user_id=config.memory_user_id,
+    )
+    invalidate_memory_pack(config.memory_user_id)
+
+
+# Memory extraction is buffered: exchanges queue up and a single consumer
+# flushes them in batches so the per-item Mem0 round-trips overlap instead of
+# running one at a time at the tail of every request.
+extract_queue = asyncio.Queue()
+EXTRACT_BATCH_SIZE = 16
+EXTRACT_FLUSH_SECONDS = 2.0
+
+
+async def _extract_worker():
+    """Drain queued exchanges in batches and overlap the Mem0 writes."""
+    while True:
+        batch = [await extract_queue.get()]
+        deadline = time.monotonic() + EXTRACT_FLUSH_SECONDS
+        while len(batch) < EXTRACT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(extract_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        # Mem0 has no batch upsert API, so overlap the individual calls
+        await asyncio.gather(
+            *[
+                asyncio.to_thread(store_exchange, user_text, ai_content)
+                for user_text, ai_content in batch
+            ],
+            return_exceptions=True,
+        )
+
+
+@app.before_serving
+async def _start_extract_worker():
+    app.add_background_task(_extract_worker)
+
+
+@app.before_serving
+async def _startup():
+    """Create tables and init Nova once per serving process.
+
+    Running this at serve time (rather than in __main__) means the debug
+    reloader's watcher process never pays for DB setup, .env loading, or
+    LLM/Mem0 client construction.
+    """
+    db.create_all()
+    print("Database initialized!")
+    init_nova()
+
+
+def clip_content(s, max_chars):
+    """Clip an oversized message, keeping its head and tail.
+
+    A single pasted blob (e.g. a 100 KB log) would otherwise be re-sent as
+    prefill on every subsequent turn of the chat.
+    """
+    if len(s) <= max_chars:
+        return s
+    half = max_chars // 2
+    return f"{s[:half]}\n...[{len(s) - max_chars} chars elided]...\n{s[-half:]}"
+
+
+async def refresh_rolling_summary(chat_id):
+    """Regenerate the rolling summary of turns evicted from the LLM window."""
+    async with app.app_context():
+        db_chat = await asyncio.to_thread(
+            lambda: Chat.query.options(selectinload(Chat.messages)).get(chat_id)
+        )
+        if not db_chat or len(db_chat.messages) <= config.sliding_window_size:
+            return
+
+        older = db_chat.messages[:-config.sliding_window_size]
+        transcript = "\n".join(f"{m.role}: {m.content}" for m in older)
+
+        try:
+            summary = await llm_client.generate(
+                "Summarize the following conversation in a few sentences, "
+                "keeping facts, decisions, and user preferences:\n\n"
+                f"{transcript}"
+            )
+        except Exception as e:
+            print(f"Rolling summary failed for chat {chat_id}: {e}")
+            return
+
+        db_chat.rolling_summary = summary
+        await asyncio.to_thread(db.session.commit)
+
+
 # =============================================================================
 # Chat/AI Endpoint using Nova LLM Client
 # =============================================================================
 
 @app.route('/api/chat', methods=['POST'])
-def chat():
+async def chat():
     """Send message and get AI response using Nova LLM client."""
-    data = request.get_json()
+    data = await request.get_json()
     
     if not data or 'text' not in data:
         return jsonify({'error': 'No message text provided'}), 400
@@ -149,37 +404,72 @@ def chat():
         # Build messages for LLM
         messages = []
         
-        # Get memory context
-        memory_context = ""
+        # Memory lookup and history load are independent I/O - run them together
+        # so pre-LLM latency is max(t_mem, t_db) instead of t_mem + t_db
+        mem_task = None
         if memory_service and memory_service.is_enabled:
-            memory_context = memory_service.get_memory_context(
-                query=user_text,
-                user_id=config.memory_user_id,
-                max_memories=5,
-            )
-        
-        # System message with memory
-        system_content = llm_client.system_instruction
-        if memory_context:
-            system_content += f"\n\n## Your Memories About This User:\n{memory_context}"
-        
-        messages.append(LLMMessage(role="system", content=system_content))
-        
-        # Load chat history if chat_id provided
+            mem_task = asyncio.create_task(asyncio.to_thread(
+                build_memory_pack, config.memory_user_id
+            ))
+
+        db_task = None
         if chat_id:
-            db_chat = Chat.query.get(chat_id)
-            if db_chat:
-                for msg in db_chat.messages:
-                    messages.append(LLMMessage(
-                        role=msg.role if msg.role != 'ai' else 'assistant',
-                        content=msg.content
-                    ))
-        
-        # Add current user message
-        messages.append(LLMMessage(role="user", content=user_text))
+            db_task = asyncio.create_task(asyncio.to_thread(
+                lambda: Chat.query.options(selectinload(Chat.messages)).get(chat_id)
+            ))
+
+        memory_context = (await mem_task)[0] if mem_task else ""
+        db_chat = (await db_task) if db_task else None
+
+        # Keep the system prompt byte-identical across calls so provider-side
+        # prompt caching can reuse the prefix; memories ride in the user turn.
+        # It goes through chat(system_override=...) rather than the message
+        # list - clients no longer scan messages for a system role.
+        system_parts = [llm_client.system_instruction]
+
+        # Chat history (if chat_id provided): send only the last N turns
+        # verbatim; older turns are represented by the rolling summary so
+        # prefill cost stays bounded as the chat grows
+        if db_chat:
+            history = db_chat.messages
+            if len(history) > config.sliding_window_size:
+                if db_chat.rolling_summary:
+                    system_parts.append(
+                        f"Summary of older conversation:\n{db_chat.rolling_summary}"
+                    )
+                app.add_background_task(refresh_rolling_summary, chat_id)
+                history = history[-config.sliding_window_size:]
+            # ~4 chars/token keeps any single message within the token budget
+            max_msg_chars = config.max_tokens_per_message * 4
+            for msg in history:
+                messages.append(LLMMessage(
+                    role=msg.role if msg.role != 'ai' else 'assistant',
+                    content=clip_content(msg.content, max_msg_chars)
+                ))
         
+        # Add current user message, with memory context attached as a block
+        if memory_context:
+            user_content = f"<memories>\n{memory_context}\n</memories>\n\n{user_text}"
+        else:
+            user_content = user_text
+        messages.append(LLMMessage(role="user", content=user_content))
+
+        system_content = "\n\n".join(system_parts)
+
+        # Serve repeated questions from cache instead of re-billing the LLM
+        cache_key = ResponseCache.make_key(
+            user_text,
+            chat_id,
+            [system_content] + [m.content for m in messages[-6:]] + sorted(
+                k for k, v in enabled_tools_config.items() if v
+            ),
+        )
+        cached_payload = response_cache.get(cache_key)
+        if cached_payload is not None:
+            return jsonify(cached_payload)
+
         # Get tools - filter based on enabled_tools
-        all_tools = registry.get_tools_for_llm()
+        all_tools = TOOLS_FOR_LLM
         
         # Define which tools belong to which category
         web_search_tools = {'web_search', 'tavily_search'}
@@ -201,47 +491,50 @@ def chat():
                 # Other tools (file ops, etc.) are always available
                 tools.append(tool)
         
-        # Call LLM asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        response: LLMResponse = loop.run_until_complete(
-            llm_client.chat(messages, tools=tools, stream=False)
+        # Call LLM directly on Quart's event loop
+        response: LLMResponse = await llm_client.chat(
+            messages, tools=tools, stream=False, system_override=system_content
         )
         
         ai_content = response.content
         
         # Handle tool calls if any
         if response.tool_calls:
+            # The assistant turn carrying the tool calls is appended exactly
+            # once; only the per-tool result messages go inside the loop
+            messages.append(LLMMessage(
+                role="assistant",
+                content=response.content,
+                tool_calls=response.tool_calls
+            ))
+
+            # Independent tool calls fan out concurrently; gather preserves
+            # order, so results zip back to their calls
+            results = await asyncio.gather(*[
+                asyncio.to_thread(execute_tool_call, tc)
+                for tc in response.tool_calls
+            ])
+
             tool_results = []
-            for tc in response.tool_calls:
-                result = execute_tool_call(tc)
+            for tc, result in zip(response.tool_calls, results):
                 tool_results.append({
-                    'tool': tc.get('name', ''),
+                    'tool': tc.name,
                     'result': result[:500] if len(result) > 500 else result
                 })
-                
-                # Add tool response to messages
-                messages.append(LLMMessage(
-                    role="assistant",
-                    content=response.content,
-                    tool_calls=response.tool_calls
-                ))
+
                 messages.append(LLMMessage(
                     role="tool",
-                    content=result,
-                    tool_call_id=tc.get('id', ''),
-                    name=tc.get('name', '')
+                    content=clip_content(result, config.max_tokens_per_message * 4),
+                    tool_call_id=tc.id,
+                    name=tc.name
                 ))
             
             # Get follow-up response
-            follow_up: LLMResponse = loop.run_until_complete(
-                llm_client.chat(messages, tools=tools, stream=False)
+            follow_up: LLMResponse = await llm_client.chat(
+                messages, tools=tools, stream=False, system_override=system_content
             )
             ai_content = follow_up.content
-        
-        loop.close()
-        
+
         # Extract reasoning from <think> tags (for models like DeepSeek)
         import re
         reasoning = None
@@ -256,21 +549,20 @@ def chat():
             # Remove the think tags from the final response
             clean_content = think_pattern.sub('', ai_content).strip()
         
-        # Extract and store memories
+        # Queue the exchange for batched memory extraction; the HTTP response
+        # doesn't wait on the memory write
         if memory_service and memory_service.is_enabled and config.memory_auto_extract:
-            memory_service.extract_and_store(
-                user_input=user_text,
-                assistant_response=clean_content,
-                user_id=config.memory_user_id,
-            )
+            extract_queue.put_nowait((user_text, clean_content))
         
-        return jsonify({
+        payload = {
             'content': clean_content,
             'reasoning': reasoning,  # The thinking/reasoning steps
             'model': config.current_model,
             'provider': config.default_provider.value,
             'processSteps': model_type == 'Thinking' or reasoning is not None
-        })
+        }
+        response_cache.put(cache_key, payload)
+        return jsonify(payload)
         
     except Exception as e:
         import traceback
@@ -281,36 +573,118 @@ def chat():
         }), 500
 
 
+@app.route('/api/chat/stream', methods=['POST'])
+async def chat_stream():
+    """Stream the AI response as Server-Sent Events.
+
+    Time-to-first-byte drops from the full generation latency to the first
+    token. Tools are not available in streaming mode; the buffered /api/chat
+    endpoint remains for tool-using requests.
+    """
+    data = await request.get_json()
+
+    if not data or 'text' not in data:
+        return jsonify({'error': 'No message text provided'}), 400
+
+    user_text = data.get('text', '')
+    chat_id = data.get('chat_id')
+
+    # Build messages the same way as the non-streaming endpoint; the system
+    # prompt is the client's own slot, so nothing to prepend here
+    messages = []
+
+    memory_context = ""
+    if memory_service and memory_service.is_enabled:
+        memory_context, _ = await asyncio.to_thread(
+            build_memory_pack, config.memory_user_id
+        )
+
+    if chat_id:
+        db_chat = await asyncio.to_thread(
+            lambda: Chat.query.options(selectinload(Chat.messages)).get(chat_id)
+        )
+        if db_chat:
+            for msg in db_chat.messages:
+                messages.append(LLMMessage(
+                    role=msg.role if msg.role != 'ai' else 'assistant',
+                    content=msg.content
+                ))
+
+    if memory_context:
+        user_content = f"<memories>\n{memory_context}\n</memories>\n\n{user_text}"
+    else:
+        user_content = user_text
+    messages.append(LLMMessage(role="user", content=user_content))
+
+    async def event_stream():
+        chunks = []
+        try:
+            stream = await llm_client.chat(messages, stream=True)
+            async for chunk in stream:
+                chunks.append(chunk)
+                yield f"data: {json.dumps({'delta': chunk})}\n\n"
+
+            full_content = ''.join(chunks)
+            yield "event: done\ndata: " + json.dumps({
+                'content': full_content,
+                'model': config.current_model,
+                'provider': config.default_provider.value,
+            }) + "\n\n"
+
+            if memory_service and memory_service.is_enabled and config.memory_auto_extract:
+                extract_queue.put_nowait((user_text, full_content))
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+
+    return Response(event_stream(), mimetype='text/event-stream')
+
+
 # =============================================================================
 # Memory Endpoints
 # =============================================================================
 
 @app.route('/api/memories', methods=['GET'])
-def get_memories():
+async def get_memories():
     """Get user memories."""
     if not memory_service or not memory_service.is_enabled:
         return jsonify({'error': 'Memory service not enabled'}), 503
     
     query = request.args.get('query', '')
-    
+
+    etag = None
     if query:
-        memories = memory_service.search(
+        memories = await asyncio.to_thread(
+            memory_service.search,
             query=query,
             user_id=config.memory_user_id,
-            limit=10
+            limit=10,
         )
     else:
-        memories = memory_service.get_all(
-            user_id=config.memory_user_id,
-            limit=20
-        )
-    
-    return jsonify([{
+        # The memory-pack version doubles as an ETag for the unfiltered list
+        _, etag = await asyncio.to_thread(build_memory_pack, config.memory_user_id)
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304, {'ETag': etag}
+        # The pack build just fetched this user's memories; reuse them instead
+        # of paying a second Mem0 round-trip on the event loop
+        cached = _memory_packs.get(config.memory_user_id)
+        if cached:
+            memories = cached[3][:20]
+        else:
+            memories = await asyncio.to_thread(
+                memory_service.get_all,
+                user_id=config.memory_user_id,
+                limit=20,
+            )
+
+    response = jsonify([{
         'id': m.id,
         'content': m.content,
         'type': m.memory_type.value,
         'created_at': m.created_at.isoformat() if m.created_at else None
     } for m in memories])
+    if etag:
+        response.headers['ETag'] = etag
+    return response
 
 
 # =============================================================================
@@ -318,25 +692,29 @@ def get_memories():
 # =============================================================================
 
 ALLOWED_EXTENSIONS = {
-    'document': {'pdf', 'doc', 'docx', 'txt', 'md'},
-    'image': {'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg'},
-    'code': {'js', 'py', 'java', 'cpp', 'c', 'html', 'css', 'json', 'xml', 'ts', 'tsx'}
+    'document': frozenset({'pdf', 'doc', 'docx', 'txt', 'md'}),
+    'image': frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg'}),
+    'code': frozenset({'js', 'py', 'java', 'cpp', 'c', 'html', 'css', 'json', 'xml', 'ts', 'tsx'})
 }
 
+_NO_EXTENSIONS = frozenset()
+
 
 def allowed_file(filename, file_type):
-    ext = filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
-    return ext in ALLOWED_EXTENSIONS.get(file_type, set())
+    ext = os.path.splitext(filename)[1][1:].lower()
+    return ext in ALLOWED_EXTENSIONS.get(file_type, _NO_EXTENSIONS)
 
 
 @app.route('/api/upload', methods=['POST'])
-def upload_file():
+async def upload_file():
     """Handle file uploads."""
-    if 'file' not in request.files:
+    files = await request.files
+    if 'file' not in files:
         return jsonify({'error': 'No file provided'}), 400
-    
-    file = request.files['file']
-    file_type = request.form.get('type', 'document')
+
+    file = files['file']
+    form = await request.form
+    file_type = form.get('type', 'document')
     
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
@@ -345,26 +723,49 @@ def upload_file():
         return jsonify({'error': f'File type not allowed for {file_type}'}), 400
     
     filename = secure_filename(file.filename)
-    
-    import time
-    unique_filename = f"{int(time.time())}_{filename}"
-    file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-    
-    file.save(file_path)
-    file_size = os.path.getsize(file_path)
-    
-    uploaded_file = UploadedFile(
-        filename=filename,
-        file_type=file_type,
-        file_path=file_path,
-        file_size=file_size
-    )
-    db.session.add(uploaded_file)
-    db.session.commit()
-    
+
+    # Stream to a temp file while hashing, then content-address the file by
+    # its digest: re-uploading identical bytes becomes a DB insert only.
+    # The chunked copy and the ORM calls are blocking, so the whole save
+    # runs on a worker thread instead of stalling the event loop
+    def save_sync():
+        hasher = hashlib.blake2b()
+        file_size = 0
+        tmp_path = os.path.join(app.config['UPLOAD_FOLDER'], f".tmp_{os.urandom(8).hex()}")
+        with open(tmp_path, 'wb') as out:
+            while chunk := file.stream.read(1 << 20):
+                hasher.update(chunk)
+                out.write(chunk)
+                file_size += len(chunk)
+
+        digest = hasher.hexdigest()
+
+        existing = UploadedFile.query.filter_by(content_hash=digest).first()
+        if existing:
+            os.remove(tmp_path)
+            file_path = existing.file_path
+        else:
+            subdir = os.path.join(app.config['UPLOAD_FOLDER'], digest[:2])
+            os.makedirs(subdir, exist_ok=True)
+            file_path = os.path.join(subdir, digest)
+            os.replace(tmp_path, file_path)
+
+        uploaded_file = UploadedFile(
+            filename=filename,
+            file_type=file_type,
+            file_path=file_path,
+            file_size=file_size,
+            content_hash=digest
+        )
+        db.session.add(uploaded_file)
+        db.session.commit()
+        return uploaded_file.id, file_size
+
+    file_id, file_size = await asyncio.to_thread(save_sync)
+
     return jsonify({
         'success': True,
-        'fileId': uploaded_file.id,
+        'fileId': file_id,
         'filename': filename,
         'file_type': file_type,
         'file_size': file_size
@@ -376,7 +777,7 @@ def upload_file():
 # =============================================================================
 
 @app.route('/api/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return jsonify({
         'status': 'ok',
@@ -391,12 +792,7 @@ def health_check():
 # =============================================================================
 
 if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
-        print("Database initialized!")
-    
-    init_nova()
-    
     print(f"Starting NARI Backend on http://localhost:5000")
-    
+
+    # For production use: hypercorn app:app --bind 0.0.0.0:5000
     app.run(host='0.0.0.0', port=5000, debug=True)
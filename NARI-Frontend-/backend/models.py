@@ -14,8 +14,9 @@ class Chat(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
+    rolling_summary = db.Column(db.Text)  # Summary of turns evicted from the LLM window
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relationship to messages
     messages = db.relationship('Message', backref='chat', lazy=True, cascade='all, delete-orphan')
@@ -29,16 +30,37 @@ class Chat(db.Model):
             'messages': [msg.to_dict() for msg in self.messages]
         }
 
+    def to_dict_fast(self):
+        """Like to_dict, but with epoch timestamps - datetime.isoformat is a
+        hotspot when serializing thousands of messages."""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'created_at': self.created_at.timestamp() if self.created_at else None,
+            'messages': [
+                {
+                    'id': msg.id,
+                    'role': msg.role,
+                    'content': msg.content,
+                    'timestamp': msg.timestamp.timestamp() if msg.timestamp else None,
+                }
+                for msg in self.messages
+            ]
+        }
+
 
 class Message(db.Model):
     """Chat message model."""
     __tablename__ = 'messages'
     
     id = db.Column(db.Integer, primary_key=True)
-    chat_id = db.Column(db.Integer, db.ForeignKey('chats.id'), nullable=False)
+    chat_id = db.Column(db.Integer, db.ForeignKey('chats.id'), nullable=False, index=True)
     role = db.Column(db.String(20), nullable=False)  # 'user' or 'ai'
     content = db.Column(db.Text, nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Ordered per-chat message reads hit this index instead of scanning
+    __table_args__ = (db.Index('ix_message_chat_timestamp', 'chat_id', 'timestamp'),)
     
     def to_dict(self):
         """Convert to dictionary for JSON response."""
@@ -59,6 +81,7 @@ class UploadedFile(db.Model):
     file_type = db.Column(db.String(50), nullable=False)  # 'document', 'image', 'code'
     file_path = db.Column(db.String(500), nullable=False)
     file_size = db.Column(db.Integer, nullable=False)
+    content_hash = db.Column(db.String(128), index=True)  # blake2b of file bytes
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     def to_dict(self):
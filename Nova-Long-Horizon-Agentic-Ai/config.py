@@ -112,6 +112,15 @@ class Config:
     max_context_messages: int = 50
     max_tokens_per_message: int = 8000
     sliding_window_size: int = 20
+
+    # LLM Traffic Control
+    max_concurrent_llm_calls: int = 8
+    llm_qpm: int = 500  # Requests-per-minute budget (sliding window)
+
+    # HTTP Connection Pool (httpx defaults cap at 100 connections)
+    http_max_connections: int = 2000
+    http_max_keepalive_connections: int = 1500
+    http_timeout: float = 120.0
     
     # Project Context
     project_root: Path = field(default_factory=lambda: Path.cwd())
@@ -7,6 +7,7 @@ Enables LangGraph agents, chains, and advanced memory integration.
 from __future__ import annotations
 
 import asyncio
+import functools
 from dataclasses import dataclass, field
 from typing import Any, AsyncGenerator, Sequence
 
@@ -136,6 +137,39 @@ class LangChainResponse:
         )
 
 
+# ============================================================================
+# LLM Construction (memoized)
+# ============================================================================
+
+@functools.lru_cache(maxsize=8)
+def _build_llm(
+    provider: ModelProvider,
+    model: str,
+    api_key: str,
+    base_url: str,
+    temperature: float,
+):
+    """
+    Build and memoize a LangChain chat model per (provider, model).
+
+    Each constructor spins up a fresh HTTP client; reusing one instance keeps
+    its pooled connections (and TLS sessions) alive across calls and provider
+    switches instead of re-handshaking every time.
+    """
+    if provider == ModelProvider.GEMINI:
+        return ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=api_key,
+            temperature=temperature,
+            convert_system_message_to_human=False,
+        )
+    return ChatOllama(
+        model=model,
+        base_url=base_url,
+        temperature=temperature,
+    )
+
+
 # ============================================================================
 # LangChain LLM Client
 # ============================================================================
@@ -154,19 +188,13 @@ class LangChainClient:
     
     def _initialize_llm(self) -> None:
         """Initialize the appropriate LLM based on config."""
-        if self.config.default_provider == ModelProvider.GEMINI:
-            self._llm = ChatGoogleGenerativeAI(
-                model=self.config.gemini_model,
-                google_api_key=self.config.google_api_key,
-                temperature=0.7,
-                convert_system_message_to_human=False,
-            )
-        else:
-            self._llm = ChatOllama(
-                model=self.config.ollama_model,
-                base_url=self.config.ollama_host,
-                temperature=0.7,
-            )
+        self._llm = _build_llm(
+            self.config.default_provider,
+            self.config.current_model,
+            self.config.google_api_key,
+            self.config.ollama_host,
+            0.7,
+        )
     
     @property
     def llm(self):
@@ -306,19 +334,14 @@ def get_langchain_client(config: Config | None = None) -> LangChainClient:
 def get_langchain_llm(config: Config | None = None):
     """Get the raw LangChain LLM (ChatGoogleGenerativeAI or ChatOllama)."""
     config = config or get_config()
-    
-    if config.default_provider == ModelProvider.GEMINI:
-        return ChatGoogleGenerativeAI(
-            model=config.gemini_model,
-            google_api_key=config.google_api_key,
-            temperature=0.7,
-        )
-    else:
-        return ChatOllama(
-            model=config.ollama_model,
-            base_url=config.ollama_host,
-            temperature=0.7,
-        )
+
+    return _build_llm(
+        config.default_provider,
+        config.current_model,
+        config.google_api_key,
+        config.ollama_host,
+        0.7,
+    )
 
 
 # ============================================================================
@@ -6,86 +6,316 @@ Provides abstract adapter pattern for Gemini and Ollama backends.
 from __future__ import annotations
 
 import asyncio
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import Any, AsyncGenerator, Callable
 
-from google import genai
-from google.genai import types
-import ollama
+import httpx
 
 from config import Config, ModelProvider, get_config
 
+# Provider SDKs are heavy imports (gRPC/protobuf for genai, HTTP client code
+# for ollama) and only one backend runs per session, so each client imports
+# its SDK on first construction and publishes it here for the module's
+# runtime uses. Annotations stay lazy via `from __future__ import annotations`.
+genai: Any = None
+types: Any = None
+ollama: Any = None
 
-@dataclass
+
+@dataclass(slots=True)
+class ToolCall:
+    """A single function call requested by the model."""
+    id: str
+    name: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict form for JSON wire boundaries."""
+        return {"id": self.id, "name": self.name, "arguments": self.arguments}
+
+
+@dataclass(slots=True)
 class Message:
     """Represents a chat message."""
     role: str  # "user", "assistant", "system", "tool"
     content: str
-    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    tool_calls: list[ToolCall] = field(default_factory=list)
     tool_call_id: str | None = None
     name: str | None = None  # For tool responses
 
+    # Per-backend converted forms, filled lazily by the clients so unchanged
+    # history isn't re-converted on every turn
+    _gemini_converted: Any = field(default=None, init=False, repr=False, compare=False)
+    _ollama_converted: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Roles come from a four-word vocabulary but arrive from many
+        # sources (factories, DB rows, wire dicts); interning them here means
+        # every downstream == check hits the pointer-equality fast path
+        self.role = sys.intern(self.role)
+
+    # Factories with interned role strings; hot callers avoid repeating the
+    # kwarg boilerplate and every instance shares the same role object
+    _ROLE_USER = sys.intern("user")
+    _ROLE_ASSISTANT = sys.intern("assistant")
+    _ROLE_TOOL = sys.intern("tool")
+
+    @classmethod
+    def user(cls, content: str) -> Message:
+        """Build a user message."""
+        return cls(role=cls._ROLE_USER, content=content)
+
+    @classmethod
+    def assistant(cls, content: str, tool_calls: list[ToolCall] | None = None) -> Message:
+        """Build an assistant message, optionally carrying tool calls."""
+        return cls(role=cls._ROLE_ASSISTANT, content=content, tool_calls=tool_calls or [])
+
+    @classmethod
+    def tool(cls, content: str, tool_call_id: str, name: str) -> Message:
+        """Build a tool-result message."""
+        return cls(role=cls._ROLE_TOOL, content=content, tool_call_id=tool_call_id, name=name)
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolDefinition:
     """Definition of a tool for LLM function calling."""
     name: str
     description: str
     parameters: dict[str, Any]
     function: Callable[..., str] | None = None
-    
+
+    # Memoized provider formats - tool definitions are effectively immutable
+    # within a session, so there's no point rebuilding them every chat turn
+    _gemini_format: types.FunctionDeclaration | None = field(default=None, init=False, repr=False, compare=False)
+    _ollama_format: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
     def to_gemini_format(self) -> types.FunctionDeclaration:
         """Convert to Gemini function declaration format."""
-        return types.FunctionDeclaration(
-            name=self.name,
-            description=self.description,
-            parameters=self.parameters,
-        )
-    
+        if self._gemini_format is None:
+            self._gemini_format = types.FunctionDeclaration(
+                name=self.name,
+                description=self.description,
+                parameters=self.parameters,
+            )
+        return self._gemini_format
+
     def to_ollama_format(self) -> dict[str, Any]:
         """Convert to Ollama tools format."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
+        if self._ollama_format is None:
+            self._ollama_format = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                }
             }
-        }
+        return self._ollama_format
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Standardized response from LLM."""
     content: str
-    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    tool_calls: list[ToolCall] = field(default_factory=list)
     finish_reason: str = "stop"
     usage: dict[str, int] = field(default_factory=dict)
     raw_response: Any = None
 
 
+@dataclass(slots=True)
+class StreamChunk:
+    """A single streamed delta with a monotonic id for ordering/resume."""
+    content: str
+    id: int
+
+
+class LLMCache:
+    """
+    Exact-key LRU cache over canonicalized chat requests.
+
+    Agent retry loops frequently re-issue byte-identical prompts; serving
+    those from memory replaces a seconds-long provider round-trip with a dict
+    lookup. (A semantic similarity tier would need a local embedding model,
+    which this project doesn't ship, so only the exact tier exists.)
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, LLMResponse] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_instruction: str,
+        messages: list[Message],
+        tools: list[ToolDefinition] | None,
+    ) -> tuple:
+        """Canonicalize a request into a hashable cache key.
+
+        Plain tuples hash directly - no JSON serialization pass over the
+        whole history on every lookup. Tool calls fold in as (name, repr of
+        arguments): the arguments dict itself is unhashable and repr is
+        stable for the JSON-shaped payloads the providers hand back.
+        """
+        return (
+            model,
+            system_instruction,
+            tuple(
+                (
+                    m.role,
+                    m.content,
+                    m.tool_call_id,
+                    m.name,
+                    tuple((tc.name, repr(tc.arguments)) for tc in m.tool_calls),
+                )
+                for m in messages
+            ),
+            tuple(t.name for t in tools) if tools else (),
+        )
+
+    def lookup(self, key: tuple) -> LLMResponse | None:
+        """Return a cached response, refreshing its LRU position."""
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def store(self, key: tuple, response: LLMResponse) -> None:
+        """Store a response, evicting the least recently used entry."""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Shared across clients so provider/model switches keep their hits separate
+# (the model name is part of the key) without duplicating storage
+llm_cache = LLMCache()
+
+
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
-    
+
+    # Interned "call_<name>" ids, shared across clients; models call the same
+    # handful of tools thousands of times, no need to reformat each time
+    _call_id_cache: dict[str, str] = {}
+
+    def _call_id(self, name: str) -> str:
+        """Return the correlation id for a tool name without reformatting."""
+        return self._call_id_cache.setdefault(sys.intern(name), "call_" + name)
+
     def __init__(self, config: Config) -> None:
         self.config = config
         self._system_instruction: str = ""
-    
+        # Concurrency limiter + sliding-window rate limiter so batch callers
+        # can't overwhelm the provider (429s) or starve the event loop
+        self._sem = asyncio.Semaphore(config.max_concurrent_llm_calls)
+        self._traffic: deque[float] = deque()
+
+    async def _throttle(self) -> None:
+        """Wait until the requests-per-minute budget allows another call."""
+        qpm = self.config.llm_qpm
+        while True:
+            now = time.monotonic()
+            while self._traffic and now - self._traffic[0] >= 60.0:
+                self._traffic.popleft()
+            if len(self._traffic) < qpm:
+                self._traffic.append(now)
+                return
+            await asyncio.sleep(60.0 - (now - self._traffic[0]))
+
+    def _http_limits(self) -> httpx.Limits:
+        """Pool limits for the underlying HTTP client."""
+        return httpx.Limits(
+            max_connections=self.config.http_max_connections,
+            max_keepalive_connections=self.config.http_max_keepalive_connections,
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle only the config; live SDK handles don't cross processes."""
+        return {
+            "config": self.config,
+            "_system_instruction": self._system_instruction,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Rebuild the client (and its connections) in the worker process."""
+        self.__init__(state["config"])
+        self._system_instruction = state["_system_instruction"]
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP sessions at shutdown (best effort)."""
+        client = getattr(self, "client", None)
+        if client is None:
+            return
+        for attr in ("aclose", "close"):
+            close = getattr(client, attr, None)
+            if close is not None:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+                return
+
     @abstractmethod
     async def chat(
         self,
         messages: list[Message],
         tools: list[ToolDefinition] | None = None,
         stream: bool = False,
+        system_override: str | None = None,
     ) -> LLMResponse | AsyncGenerator[str, None]:
-        """Send chat messages and get a response."""
+        """Send chat messages and get a response.
+
+        ``system_override`` replaces the client's system instruction for this
+        call; system-role entries in ``messages`` are ignored.
+        """
         pass
     
     @abstractmethod
     async def generate(self, prompt: str) -> str:
         """Generate a simple text response."""
         pass
+
+    async def chat_many(
+        self,
+        batches: list[list[Message]],
+        tools: list[ToolDefinition] | None = None,
+        system_override: str | None = None,
+    ) -> list[LLMResponse]:
+        """Run independent chat calls concurrently.
+
+        Results come back in batch order. Concurrency is bounded by the
+        client's semaphore and QPM budget, so total latency approaches
+        max(call_i) rather than sum(call_i).
+        """
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self.chat(batch, tools=tools, system_override=system_override))
+                for batch in batches
+            ]
+        return [task.result() for task in tasks]
+
+    async def astream_messages(
+        self,
+        messages: list[Message],
+        tools: list[ToolDefinition] | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Stream a chat response as identified chunks.
+
+        Thin wrapper over ``chat(stream=True)`` for callers that want
+        addressable deltas (e.g. UIs that coalesce or replay partial output)
+        rather than bare strings.
+        """
+        stream = await self.chat(messages, tools=tools, stream=True)
+        index = 0
+        async for text in stream:
+            yield StreamChunk(content=text, id=index)
+            index += 1
     
     def set_system_instruction(self, instruction: str) -> None:
         """Set the system instruction for the model."""
@@ -114,9 +344,24 @@ class GeminiClient(LLMClient):
     
     def __init__(self, config: Config) -> None:
         super().__init__(config)
-        
-        # Configure the Gemini client
-        self.client = genai.Client(api_key=config.google_api_key)
+
+        global genai, types
+        if genai is None:
+            from google import genai as genai_module
+            from google.genai import types as types_module
+            genai, types = genai_module, types_module
+
+        # Configure the Gemini client with a raised connection-pool ceiling;
+        # httpx's default 100-connection cap throttles high-concurrency runs
+        self.client = genai.Client(
+            api_key=config.google_api_key,
+            http_options=types.HttpOptions(
+                async_client_args={
+                    "limits": self._http_limits(),
+                    "timeout": httpx.Timeout(config.http_timeout),
+                },
+            ),
+        )
         self.model_name = config.gemini_model
         
         # Safety settings - set to BLOCK_NONE for developer freedom
@@ -138,105 +383,140 @@ class GeminiClient(LLMClient):
                 threshold="OFF",
             ),
         ]
+
+        # Memoized _create_tools_config result (see that method)
+        self._tools_config: list[types.Tool] = []
+        self._tools_config_key: tuple[int, ...] | None = None
+
+        # Memoized GenerateContentConfig - safety settings are constant and
+        # system/tools rarely change within a session
+        self._generate_cfg: types.GenerateContentConfig | None = None
+        self._generate_cfg_key: tuple[str, int] | None = None
     
+    def _convert_one_to_gemini(self, msg: Message) -> types.Content:
+        """Convert a single message to Gemini format."""
+        role = "user" if msg.role == "user" else "model"
+
+        if msg.tool_calls:
+            # Handle function calls
+            parts = []
+            if msg.content:
+                parts.append(types.Part.from_text(text=msg.content))
+            for tc in msg.tool_calls:
+                parts.append(types.Part.from_function_call(
+                    name=tc.name,
+                    args=tc.arguments,
+                ))
+            return types.Content(role=role, parts=parts)
+
+        if msg.role == "tool":
+            # Tool response
+            return types.Content(
+                role="user",
+                parts=[types.Part.from_function_response(
+                    name=msg.name,
+                    response={"result": msg.content},
+                )]
+            )
+
+        return types.Content(
+            role=role,
+            parts=[types.Part.from_text(text=msg.content)]
+        )
+
     def _convert_messages_to_gemini(self, messages: list[Message]) -> list[types.Content]:
-        """Convert messages to Gemini format."""
+        """Convert messages to Gemini format, reusing cached conversions."""
         gemini_messages = []
-        
+
         for msg in messages:
             if msg.role == "system":
                 continue  # System handled via system_instruction
-            
-            role = "user" if msg.role == "user" else "model"
-            
-            if msg.tool_calls:
-                # Handle function calls
-                parts = []
-                if msg.content:
-                    parts.append(types.Part.from_text(text=msg.content))
-                for tc in msg.tool_calls:
-                    parts.append(types.Part.from_function_call(
-                        name=tc["name"],
-                        args=tc.get("arguments", {}),
-                    ))
-                gemini_messages.append(types.Content(role=role, parts=parts))
-            elif msg.role == "tool":
-                # Tool response
-                gemini_messages.append(types.Content(
-                    role="user",
-                    parts=[types.Part.from_function_response(
-                        name=msg.name,
-                        response={"result": msg.content},
-                    )]
-                ))
-            else:
-                gemini_messages.append(types.Content(
-                    role=role,
-                    parts=[types.Part.from_text(text=msg.content)]
-                ))
-        
+
+            # History is mostly identical between turns; converting each
+            # message once keeps per-turn conversion cost at O(new messages)
+            if msg._gemini_converted is None:
+                msg._gemini_converted = self._convert_one_to_gemini(msg)
+            gemini_messages.append(msg._gemini_converted)
+
         return gemini_messages
     
     def _create_tools_config(self, tools: list[ToolDefinition]) -> list[types.Tool]:
-        """Create Gemini tools configuration."""
+        """Create Gemini tools configuration (memoized per tool set)."""
         if not tools:
             return []
-        
-        function_declarations = [tool.to_gemini_format() for tool in tools]
-        return [types.Tool(function_declarations=function_declarations)]
+
+        # The same tool list is passed turn after turn; key on identity so an
+        # unchanged set reuses the previously built Tool wrapper
+        key = tuple(id(t) for t in tools)
+        if key != self._tools_config_key:
+            function_declarations = [tool.to_gemini_format() for tool in tools]
+            self._tools_config = [types.Tool(function_declarations=function_declarations)]
+            self._tools_config_key = key
+        return self._tools_config
     
     async def chat(
         self,
         messages: list[Message],
         tools: list[ToolDefinition] | None = None,
         stream: bool = False,
+        system_override: str | None = None,
     ) -> LLMResponse | AsyncGenerator[str, None]:
         """Send chat messages to Gemini."""
-        
-        # Extract system instruction from messages (includes memory context)
-        system_content = self.system_instruction
-        for msg in messages:
-            if msg.role == "system":
-                system_content = msg.content
-                break
-        
+
+        # System content comes from the dedicated slot (or per-call override),
+        # not from scanning the message list every turn
+        system_content = system_override if system_override is not None else self.system_instruction
+
         gemini_messages = self._convert_messages_to_gemini(messages)
         tools_config = self._create_tools_config(tools) if tools else None
-        
-        # Build generation config with the system content from messages
-        generate_config = types.GenerateContentConfig(
-            system_instruction=system_content,
-            safety_settings=self.safety_settings,
-            tools=tools_config,
-        )
-        
+
+        # Reuse the generation config while system content and tool set are
+        # unchanged; pydantic model construction is not free on the hot path
+        cfg_key = (system_content, id(tools_config))
+        if cfg_key != self._generate_cfg_key:
+            self._generate_cfg = types.GenerateContentConfig(
+                system_instruction=system_content,
+                safety_settings=self.safety_settings,
+                tools=tools_config,
+            )
+            self._generate_cfg_key = cfg_key
+        generate_config = self._generate_cfg
+
         if stream:
             return self._stream_response(gemini_messages, generate_config)
-        
-        # Non-streaming response
-        response = await asyncio.to_thread(
-            self.client.models.generate_content,
-            model=self.model_name,
-            contents=gemini_messages,
-            config=generate_config,
-        )
-        
-        return self._parse_response(response)
-    
+
+        cache_key = llm_cache.make_key(self.model_name, system_content, messages, tools)
+        cached = llm_cache.lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        # Non-streaming response via the SDK's native async client - no
+        # thread-hop, so concurrency isn't capped by the executor pool
+        async with self._sem:
+            await self._throttle()
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=gemini_messages,
+                config=generate_config,
+            )
+
+        parsed = self._parse_response(response)
+        llm_cache.store(cache_key, parsed)
+        return parsed
+
     async def _stream_response(
         self,
         messages: list[types.Content],
         config: types.GenerateContentConfig,
     ) -> AsyncGenerator[str, None]:
         """Stream response from Gemini."""
-        response_stream = await asyncio.to_thread(
-            self.client.models.generate_content_stream,
+        response_stream = await self.client.aio.models.generate_content_stream(
             model=self.model_name,
             contents=messages,
             config=config,
         )
-        
-        for chunk in response_stream:
+
+        async for chunk in response_stream:
             if chunk.text:
                 yield chunk.text
     
@@ -252,11 +532,16 @@ class GeminiClient(LLMClient):
                     content += part.text
                 elif hasattr(part, "function_call") and part.function_call:
                     fc = part.function_call
-                    tool_calls.append({
-                        "id": f"call_{fc.name}",
-                        "name": fc.name,
-                        "arguments": dict(fc.args) if fc.args else {},
-                    })
+                    # Downstream only reads the arguments, so keep a direct
+                    # reference when the SDK already hands us a dict
+                    args = fc.args
+                    if not isinstance(args, dict):
+                        args = dict(args) if args else {}
+                    tool_calls.append(ToolCall(
+                        id=self._call_id(fc.name),
+                        name=fc.name,
+                        arguments=args,
+                    ))
         
         usage = {}
         if hasattr(response, "usage_metadata") and response.usage_metadata:
@@ -277,8 +562,7 @@ class GeminiClient(LLMClient):
     
     async def generate(self, prompt: str) -> str:
         """Generate a simple text response."""
-        response = await asyncio.to_thread(
-            self.client.models.generate_content,
+        response = await self.client.aio.models.generate_content(
             model=self.model_name,
             contents=prompt,
             config=types.GenerateContentConfig(
@@ -294,20 +578,27 @@ class OllamaClient(LLMClient):
     
     def __init__(self, config: Config) -> None:
         super().__init__(config)
-        self.client = ollama.Client(host=config.ollama_host)
+
+        global ollama
+        if ollama is None:
+            import ollama as ollama_module
+            ollama = ollama_module
+
+        self.client = ollama.AsyncClient(
+            host=config.ollama_host,
+            timeout=config.http_timeout,
+            limits=self._http_limits(),
+        )
         self.model_name = config.ollama_model
     
-    def _convert_messages_to_ollama(self, messages: list[Message]) -> list[dict[str, Any]]:
+    def _convert_messages_to_ollama(
+        self,
+        messages: list[Message],
+        system_content: str,
+    ) -> list[dict[str, Any]]:
         """Convert messages to Ollama format."""
         ollama_messages = []
-        
-        # Extract system message from the passed messages (includes memory context)
-        system_content = self.system_instruction
-        for msg in messages:
-            if msg.role == "system":
-                system_content = msg.content
-                break
-        
+
         # Add system message with memory context
         if system_content:
             ollama_messages.append({
@@ -318,71 +609,88 @@ class OllamaClient(LLMClient):
         for msg in messages:
             if msg.role == "system":
                 continue  # Already handled above
-            
-            message_dict: dict[str, Any] = {
-                "role": msg.role if msg.role != "tool" else "tool",
-                "content": msg.content,
-            }
-            
-            if msg.tool_calls:
-                message_dict["tool_calls"] = [
-                    {
-                        "id": tc.get("id", ""),
-                        "type": "function",
-                        "function": {
-                            "name": tc["name"],
-                            "arguments": tc.get("arguments", {}),
-                        }
-                    }
-                    for tc in msg.tool_calls
-                ]
-            
-            if msg.tool_call_id:
-                message_dict["tool_call_id"] = msg.tool_call_id
-            
-            ollama_messages.append(message_dict)
-        
+
+            # Same trick as the Gemini client: convert each message once and
+            # reuse the cached dict on subsequent turns
+            if msg._ollama_converted is None:
+                msg._ollama_converted = self._convert_one_to_ollama(msg)
+            ollama_messages.append(msg._ollama_converted)
+
         return ollama_messages
+
+    def _convert_one_to_ollama(self, msg: Message) -> dict[str, Any]:
+        """Convert a single message to Ollama format."""
+        message_dict: dict[str, Any] = {
+            "role": msg.role if msg.role != "tool" else "tool",
+            "content": msg.content,
+        }
+
+        if msg.tool_calls:
+            message_dict["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": tc.arguments,
+                    }
+                }
+                for tc in msg.tool_calls
+            ]
+
+        if msg.tool_call_id:
+            message_dict["tool_call_id"] = msg.tool_call_id
+
+        return message_dict
     
     async def chat(
         self,
         messages: list[Message],
         tools: list[ToolDefinition] | None = None,
         stream: bool = False,
+        system_override: str | None = None,
     ) -> LLMResponse | AsyncGenerator[str, None]:
         """Send chat messages to Ollama."""
-        
-        ollama_messages = self._convert_messages_to_ollama(messages)
+
+        system_content = system_override if system_override is not None else self.system_instruction
+        ollama_messages = self._convert_messages_to_ollama(messages, system_content)
         ollama_tools = [tool.to_ollama_format() for tool in tools] if tools else None
-        
+
         if stream:
             return self._stream_response(ollama_messages, ollama_tools)
-        
-        # Non-streaming response
-        response = await asyncio.to_thread(
-            self.client.chat,
-            model=self.model_name,
-            messages=ollama_messages,
-            tools=ollama_tools,
-        )
-        
-        return self._parse_response(response)
-    
+
+        cache_key = llm_cache.make_key(self.model_name, system_content, messages, tools)
+        cached = llm_cache.lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        # Non-streaming response on the async client - no thread-hop
+        async with self._sem:
+            await self._throttle()
+            response = await self.client.chat(
+                model=self.model_name,
+                messages=ollama_messages,
+                tools=ollama_tools,
+            )
+
+        parsed = self._parse_response(response)
+        llm_cache.store(cache_key, parsed)
+        return parsed
+
     async def _stream_response(
         self,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]] | None,
     ) -> AsyncGenerator[str, None]:
         """Stream response from Ollama."""
-        stream = await asyncio.to_thread(
-            self.client.chat,
+        stream = await self.client.chat(
             model=self.model_name,
             messages=messages,
             tools=tools,
             stream=True,
         )
-        
-        for chunk in stream:
+
+        async for chunk in stream:
             if chunk.get("message", {}).get("content"):
                 yield chunk["message"]["content"]
     
@@ -395,11 +703,11 @@ class OllamaClient(LLMClient):
         if message.get("tool_calls"):
             for tc in message["tool_calls"]:
                 func = tc.get("function", {})
-                tool_calls.append({
-                    "id": tc.get("id", f"call_{func.get('name', 'unknown')}"),
-                    "name": func.get("name", ""),
-                    "arguments": func.get("arguments", {}),
-                })
+                tool_calls.append(ToolCall(
+                    id=tc.get("id") or self._call_id(func.get("name", "unknown")),
+                    name=func.get("name", ""),
+                    arguments=func.get("arguments", {}),
+                ))
         
         return LLMResponse(
             content=content,
@@ -415,8 +723,7 @@ class OllamaClient(LLMClient):
     
     async def generate(self, prompt: str) -> str:
         """Generate a simple text response."""
-        response = await asyncio.to_thread(
-            self.client.generate,
+        response = await self.client.generate(
             model=self.model_name,
             prompt=f"{self.system_instruction}\n\n{prompt}" if self.system_instruction else prompt,
         )
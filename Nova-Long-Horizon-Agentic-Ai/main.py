@@ -6,17 +6,27 @@ Async event loop with AgentLoop, MemoryManager, and slash commands.
 from __future__ import annotations
 
 import asyncio
+import operator
 import sys
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterator
 
 import typer
 
 from config import Config, ModelProvider, get_config, reload_config
-from llm_client import LLMClient, LLMResponse, Message, get_client
-from mem_0 import MemoryService, get_memory_service
-from tools import execute_tool_call, get_tool_descriptions, registry
+from llm_client import LLMClient, LLMResponse, Message, ToolCall, get_client
+from mem_0 import MemoryService, MemoryType, get_memory_service
+from tools import (
+    execute_tool_call,
+    get_project_structure,
+    get_tool_descriptions,
+    invalidate_config_cache,
+    registry,
+)
 from tui import GeminiCodeTUI, create_tui
 
 
@@ -24,55 +34,77 @@ from tui import GeminiCodeTUI, create_tui
 # Memory Manager
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MemoryManager:
     """
     Manages conversation context with a sliding window approach.
     Keeps prompts efficient while maintaining conversation coherence.
     """
     
-    messages: list[Message] = field(default_factory=list)
     max_messages: int = 50
     sliding_window_size: int = 20
     total_tokens_used: int = 0
-    
+    _system: list[Message] = field(default_factory=list, repr=False)
+    _recent: deque[Message] | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        # A bounded deque evicts old turns automatically - no per-add window
+        # scan or list rebuild in the hot loop
+        self._recent = deque(maxlen=self.sliding_window_size)
+
     def add_message(self, message: Message) -> None:
         """Add a message to the conversation history."""
-        self.messages.append(message)
-        
-        # Apply sliding window if we exceed max
-        if len(self.messages) > self.max_messages:
-            self._apply_sliding_window()
-    
-    def _apply_sliding_window(self) -> None:
-        """
-        Apply sliding window to keep conversation manageable.
-        Keeps system message + last N messages.
-        """
-        # Find system messages to preserve
-        system_messages = [m for m in self.messages if m.role == "system"]
-        
-        # Keep last N non-system messages
-        non_system = [m for m in self.messages if m.role != "system"]
-        recent = non_system[-self.sliding_window_size:]
-        
-        # Reconstruct messages
-        self.messages = system_messages + recent
-    
+        if message.role == "system":
+            self._system.append(message)
+        else:
+            self._recent.append(message)
+
     def get_messages(self) -> list[Message]:
         """Get all messages in the conversation."""
-        return self.messages.copy()
-    
+        return self._system + list(self._recent)
+
+    def update_system_message(self, fragment: str) -> None:
+        """Fold ``fragment`` into the single system message.
+
+        Providers expect one system block; growing it in place avoids both a
+        second system entry and the churn of re-adding messages.
+        """
+        if self._system:
+            base = self._system[0]
+            base.content = f"{base.content}\n\n{fragment}"
+        else:
+            self._system.append(Message(role="system", content=fragment))
+
+    @property
+    def system_text(self) -> str:
+        """Combined system content, passed to clients as a dedicated slot
+        instead of being rediscovered by scanning the message list."""
+        return "\n\n".join(msg.content for msg in self._system)
+
+    def last_assistant_content(self) -> str | None:
+        """Content of the most recent assistant message, or None.
+
+        Walks backwards and stops at the first hit rather than building a
+        role-filtered list of the whole history.
+        """
+        for msg in reversed(self._recent):
+            if msg.role == "assistant":
+                return msg.content
+        return None
+
+    def iter_messages(self) -> Iterator[Message]:
+        """Iterate all messages without building an intermediate list."""
+        return chain(self._system, self._recent)
+
     def clear(self) -> None:
         """Clear all messages except system."""
-        system_messages = [m for m in self.messages if m.role == "system"]
-        self.messages = system_messages
+        self._recent.clear()
         self.total_tokens_used = 0
-    
+
     def get_context_summary(self) -> str:
         """Get a summary of the current context."""
         return (
-            f"Messages: {len(self.messages)}, "
+            f"Messages: {len(self._system) + len(self._recent)}, "
             f"Tokens used: {self.total_tokens_used:,}"
         )
     
@@ -85,7 +117,16 @@ class MemoryManager:
 # Slash Command Handler
 # ============================================================================
 
-@dataclass
+# Loop-invariant lookup for /memory rendering - one dict for the process,
+# not one per rendered memory
+_MEMORY_TYPE_ICONS = {
+    "episodic": "📅",
+    "semantic": "💡",
+    "procedural": "⚙️",
+}
+
+
+@dataclass(slots=True)
 class SlashCommand:
     """Represents a slash command."""
     name: str
@@ -99,6 +140,11 @@ class SlashCommandHandler:
     def __init__(self, agent_loop: AgentLoop) -> None:
         self.agent = agent_loop
         self._commands: dict[str, SlashCommand] = {}
+        # Character trie over command names; answers "what starts with /me"
+        # in O(prefix) for completion and typo suggestions
+        self._cmd_trie: dict[Any, Any] = {}
+        self._help_cache: str | None = None
+        self._tools_cache: str | None = None
         self._register_default_commands()
     
     def _register_default_commands(self) -> None:
@@ -124,10 +170,36 @@ class SlashCommandHandler:
     ) -> None:
         """Register a new slash command."""
         self._commands[name] = SlashCommand(name, description, handler)
+        node = self._cmd_trie
+        for ch in name:
+            node = node.setdefault(ch, {})
+        node[None] = name  # terminal sentinel
+        self._help_cache = None
+
+    def complete(self, prefix: str) -> list[str]:
+        """Command names starting with ``prefix``, in sorted order."""
+        node = self._cmd_trie
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return []
+        names = []
+        stack = [node]
+        while stack:
+            for key, child in stack.pop().items():
+                if key is None:
+                    names.append(child)
+                else:
+                    stack.append(child)
+        return sorted(names)
     
     def is_command(self, text: str) -> bool:
-        """Check if text is a slash command."""
-        return text.strip().startswith("/")
+        """Check if text is a slash command, without allocating a strip copy."""
+        for ch in text:
+            if ch.isspace():
+                continue
+            return ch == "/"
+        return False
     
     async def execute(self, text: str) -> bool:
         """
@@ -136,16 +208,36 @@ class SlashCommandHandler:
         Returns:
             True if command was handled, False otherwise
         """
-        if not self.is_command(text):
+        # Single scan with index math - the strip/slice/split chain allocated
+        # three temporaries per submitted line; only the short command-name
+        # slice and args tail are materialized here
+        s = text
+        n = len(s)
+        i = 0
+        while i < n and s[i].isspace():
+            i += 1
+        if i >= n or s[i] != "/":
             return False
-        
-        parts = text.strip()[1:].split(maxsplit=1)
-        cmd_name = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
-        
+
+        j = s.find(" ", i + 1)
+        if j < 0:
+            j = n
+        cmd_name = s[i + 1:j].lower()
+        args = s[j + 1:].strip() if j < n else ""
+
         if cmd_name not in self._commands:
+            # Suggest commands sharing the longest typed prefix
+            suggestions: list[str] = []
+            prefix = cmd_name
+            while prefix and not suggestions:
+                suggestions = self.complete(prefix)
+                prefix = prefix[:-1]
+            hint = (
+                "Did you mean: " + ", ".join(f"/{name}" for name in suggestions) + "\n"
+                if suggestions else ""
+            )
             self.agent.tui.render_error(
-                f"Unknown command: /{cmd_name}\nUse /help to see available commands."
+                f"Unknown command: /{cmd_name}\n{hint}Use /help to see available commands."
             )
             return True
         
@@ -159,34 +251,33 @@ class SlashCommandHandler:
     
     async def _cmd_init(self, args: str) -> None:
         """Initialize project context."""
-        from pathlib import Path
-        
         project_path = Path(args.strip()) if args.strip() else Path.cwd()
-        
-        if not project_path.exists():
-            self.agent.tui.render_error(f"Path does not exist: {project_path}")
+
+        if not project_path.is_dir():
+            self.agent.tui.render_error(f"Path is not a directory: {project_path}")
             return
-        
-        self.agent.config.project_root = project_path.resolve()
-        
+
+        # resolve() is a realpath syscall - do it once and reuse
+        resolved = project_path.resolve()
+        self.agent.config.project_root = resolved
+        invalidate_config_cache()
+        self.agent.tui.refresh_cwd()
+
         # Build project context
-        from tools import get_project_structure
         structure = get_project_structure(max_depth=2)
-        
-        # Add to system context
-        context_message = Message(
-            role="system",
-            content=f"""Project initialized at: {project_path.resolve()}
+
+        # Fold into the existing system message rather than adding another
+        self.agent.memory.update_system_message(
+            f"""Project initialized at: {resolved}
 
 Project structure:
 {structure}
 
-Remember this context when answering questions about the project.""",
+Remember this context when answering questions about the project."""
         )
-        self.agent.memory.add_message(context_message)
-        
+
         self.agent.tui.render_success(
-            f"Initialized project context at: {project_path.resolve()}",
+            f"Initialized project context at: {resolved}",
             title="Project Initialized",
         )
         self.agent.tui.state.add_activity("Initialized project", str(project_path))
@@ -196,15 +287,15 @@ Remember this context when answering questions about the project.""",
         config = self.agent.config
         
         if not args:
-            # Show current config
-            info = [
-                f"**Provider:** {config.default_provider.value}",
-                f"**Model:** {config.current_model}",
-                f"**User:** {config.user_name}",
-                f"**Org:** {config.org_name}",
-                f"**Project Root:** {config.project_root}",
-            ]
-            self.agent.tui.render_info("\n".join(info), title="Configuration")
+            # Show current config - one f-string, not a list + join
+            info = (
+                f"**Provider:** {config.default_provider.value}\n"
+                f"**Model:** {config.current_model}\n"
+                f"**User:** {config.user_name}\n"
+                f"**Org:** {config.org_name}\n"
+                f"**Project Root:** {config.project_root}"
+            )
+            self.agent.tui.render_info(info, title="Configuration")
         else:
             # Parse config change
             parts = args.split("=", 1)
@@ -238,17 +329,20 @@ Remember this context when answering questions about the project.""",
     
     async def _cmd_help(self, args: str) -> None:
         """Show help for commands."""
-        help_lines = ["**Available Commands:**\n"]
-        
-        for cmd in sorted(self._commands.values(), key=lambda c: c.name):
-            help_lines.append(f"• **/{cmd.name}** - {cmd.description}")
-        
-        self.agent.tui.render_info("\n".join(help_lines), title="Help")
-    
+        # The command set is fixed after registration; render once and reuse
+        if self._help_cache is None:
+            help_lines = ["**Available Commands:**\n"]
+            for cmd in sorted(self._commands.values(), key=operator.attrgetter("name")):
+                help_lines.append(f"• **/{cmd.name}** - {cmd.description}")
+            self._help_cache = "\n".join(help_lines)
+
+        self.agent.tui.render_info(self._help_cache, title="Help")
+
     async def _cmd_tools(self, args: str) -> None:
         """Show available tools."""
-        tools_desc = get_tool_descriptions()
-        self.agent.tui.render_info(tools_desc, title="Available Tools")
+        if self._tools_cache is None:
+            self._tools_cache = get_tool_descriptions()
+        self.agent.tui.render_info(self._tools_cache, title="Available Tools")
     
     async def _cmd_model(self, args: str) -> None:
         """Switch between models."""
@@ -256,15 +350,15 @@ Remember this context when answering questions about the project.""",
             current = self.agent.config.current_model
             provider = self.agent.config.default_provider.value
             
-            info = [
-                f"**Current:** {provider} - {current}",
-                "",
-                "**Usage:**",
-                "• `/model gemini` - Switch to Gemini",
-                "• `/model ollama` - Switch to Ollama (local)",
-                "• `/model gemini-1.5-flash` - Use specific model",
-            ]
-            self.agent.tui.render_info("\n".join(info), title="Model Selection")
+            info = (
+                f"**Current:** {provider} - {current}\n"
+                "\n"
+                "**Usage:**\n"
+                "• `/model gemini` - Switch to Gemini\n"
+                "• `/model ollama` - Switch to Ollama (local)\n"
+                "• `/model gemini-1.5-flash` - Use specific model"
+            )
+            self.agent.tui.render_info(info, title="Model Selection")
             return
         
         model = args.strip().lower()
@@ -297,14 +391,14 @@ Remember this context when answering questions about the project.""",
             stats = self.agent.memory_service.get_stats()
             memory_status = f"{stats.get('total_memories', 0)} memories"
         
-        info = [
-            f"**Model:** {config.current_model}",
-            f"**Provider:** {config.default_provider.value}",
-            f"**Context:** {context}",
-            f"**Memory:** {memory_status}",
-            f"**Project:** {config.project_root}",
-        ]
-        self.agent.tui.render_info("\n".join(info), title="Status")
+        info = (
+            f"**Model:** {config.current_model}\n"
+            f"**Provider:** {config.default_provider.value}\n"
+            f"**Context:** {context}\n"
+            f"**Memory:** {memory_status}\n"
+            f"**Project:** {config.project_root}"
+        )
+        self.agent.tui.render_info(info, title="Status")
     
     async def _cmd_memory(self, args: str) -> None:
         """View and search memories."""
@@ -335,12 +429,9 @@ Remember this context when answering questions about the project.""",
         
         lines = []
         for mem in memories:
-            type_icon = {
-                "episodic": "📅",
-                "semantic": "💡",
-                "procedural": "⚙️",
-            }.get(mem.memory_type.value, "•")
-            lines.append(f"{type_icon} `{mem.id[:8]}` {mem.content[:100]}..." if len(mem.content) > 100 else f"{type_icon} `{mem.id[:8]}` {mem.content}")
+            type_icon = _MEMORY_TYPE_ICONS.get(mem.memory_type.value, "•")
+            content = mem.content[:100] + ("..." if len(mem.content) > 100 else "")
+            lines.append(f"{type_icon} `{mem.id[:8]}` {content}")
         
         self.agent.tui.render_info("\n".join(lines), title=title)
     
@@ -374,19 +465,19 @@ Remember this context when answering questions about the project.""",
         
         # Delete specific memory - support partial ID matching
         partial_id = args.strip().strip("<>")  # Remove any accidental angle brackets
-        
-        # Find the full ID by matching the prefix
-        memories = self.agent.memory_service.get_all(
-            user_id=self.agent.config.memory_user_id,
-            limit=100,
-        )
-        
-        full_id = None
-        for mem in memories:
-            if mem.id.startswith(partial_id):
-                full_id = mem.id
-                break
-        
+
+        # Resolve via the sorted-id index rather than scanning every memory
+        try:
+            full_id = self.agent.memory_service.resolve_prefix(
+                partial_id,
+                user_id=self.agent.config.memory_user_id,
+            )
+        except ValueError:
+            self.agent.tui.render_error(
+                f"Ambiguous memory ID prefix: {partial_id}. Give more characters."
+            )
+            return
+
         if not full_id:
             self.agent.tui.render_error(f"No memory found matching ID: {partial_id}")
             return
@@ -407,7 +498,6 @@ Remember this context when answering questions about the project.""",
             self.agent.tui.render_error("Usage: /remember <text to remember>")
             return
         
-        from mem_0 import MemoryType
         success = self.agent.memory_service.add_text(
             text=args.strip(),
             user_id=self.agent.config.memory_user_id,
@@ -422,6 +512,9 @@ Remember this context when answering questions about the project.""",
     async def _cmd_quit(self, args: str) -> None:
         """Exit the application."""
         self.agent.tui.render_info("Goodbye! 👋", title="Exiting")
+        # Let in-flight background memory extractions finish before exit
+        if self.agent._bg_tasks:
+            await asyncio.gather(*self.agent._bg_tasks, return_exceptions=True)
         self.agent.running = False
 
 
@@ -461,73 +554,102 @@ class AgentLoop:
         self.running = False
         self._thinking_task: asyncio.Task | None = None
         self._last_user_input: str = ""  # Track for memory extraction
+        # Strong refs to fire-and-forget tasks so the event loop can't GC
+        # them mid-flight; flushed on quit
+        self._bg_tasks: set[asyncio.Task] = set()
         
         # Add system message
         self._initialize_system_message()
     
     def _initialize_system_message(self) -> None:
-        """Add the initial system message with memory context."""
-        # Get persistent memory context
-        memory_context = ""
-        if self.memory_service.is_enabled:
-            memory_context = self.memory_service.get_memory_context(
-                query="user preferences and recent context",
-                user_id=self.config.memory_user_id,
-                max_memories=self.config.memory_search_limit,
-            )
-        
-        # Build system instruction with memories
-        system_content = self.client.system_instruction
-        if memory_context:
-            system_content += f"\n\n## Your Memories About This User:\n{memory_context}\n\nUse these memories to provide personalized, context-aware assistance."
-        
-        system_msg = Message(
+        """Add the initial system message; memories attach in the background."""
+        self.memory.add_message(Message(
             role="system",
-            content=system_content,
+            content=self.client.system_instruction,
+        ))
+
+    async def _load_memory_context(self) -> None:
+        """Fetch persistent memory context off the startup critical path.
+
+        run() kicks this off as a background task so the vector-search
+        round-trip overlaps with the first prompt instead of blocking it;
+        the result lands as an extra system message once available.
+        """
+        if not self.memory_service.is_enabled:
+            return
+
+        memory_context = await asyncio.to_thread(
+            self.memory_service.get_memory_context,
+            query="user preferences and recent context",
+            user_id=self.config.memory_user_id,
+            max_memories=self.config.memory_search_limit,
         )
-        self.memory.add_message(system_msg)
+        if memory_context:
+            self.memory.update_system_message(
+                f"## Your Memories About This User:\n{memory_context}\n\nUse these memories to provide personalized, context-aware assistance."
+            )
     
-    async def _process_tool_calls(self, tool_calls: list[dict[str, Any]]) -> list[Message]:
+    async def _stop_thinking(self, thinking_task: asyncio.Task | None) -> None:
+        """Tear the spinner down deterministically.
+
+        Cancelling and awaiting the task replaces the old 'sleep so the
+        spinner can settle' pauses, which cost real latency every turn.
+        """
+        self.tui.stop_thinking()
+        if thinking_task and not thinking_task.done():
+            thinking_task.cancel()
+            try:
+                await thinking_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _process_tool_calls(self, tool_calls: list[ToolCall]) -> list[Message]:
         """
         Process tool calls from LLM response.
-        
+
         Returns:
             List of tool response messages
         """
-        tool_responses = []
-        
+        # Show every launch before blocking on any result
         for tc in tool_calls:
-            tool_name = tc.get("name", "")
-            arguments = tc.get("arguments", {})
-            tool_id = tc.get("id", f"call_{tool_name}")
-            
-            # Show tool call in TUI
-            self.tui.render_tool_call(tool_name, arguments)
-            
-            # Execute tool
-            result = execute_tool_call(tc)
-            
+            self.tui.render_tool_call(tc.name, tc.arguments)
+
+        # Tools are independent; overlap them on worker threads, capped so
+        # filesystem tools can't exhaust descriptors. Network-bound tools
+        # launch first so their round-trips overlap the local ones when the
+        # cap is contended
+        sem = asyncio.Semaphore(8)
+        order = sorted(
+            range(len(tool_calls)),
+            key=lambda i: not registry.is_io_bound(tool_calls[i].name),
+        )
+
+        async def run_one(tc: ToolCall) -> str:
+            async with sem:
+                return await asyncio.to_thread(execute_tool_call, tc)
+
+        gathered = await asyncio.gather(*(run_one(tool_calls[i]) for i in order))
+        results: list[str] = [""] * len(tool_calls)
+        for i, res in zip(order, gathered):
+            results[i] = res
+
+        tool_responses = []
+        for tc, result in zip(tool_calls, results):
             # Show result
-            self.tui.render_tool_call(tool_name, arguments, result)
-            
+            self.tui.render_tool_call(tc.name, tc.arguments, result)
+
             # Add to responses
-            tool_responses.append(Message(
-                role="tool",
-                content=result,
-                tool_call_id=tool_id,
-                name=tool_name,
-            ))
-            
+            tool_responses.append(Message.tool(result, tool_call_id=tc.id, name=tc.name))
+
             # Track activity
-            self.tui.state.add_activity(f"Used {tool_name}")
-        
+            self.tui.state.add_activity(f"Used {tc.name}")
+
         return tool_responses
     
     async def _chat(self, user_input: str) -> None:
         """Process a chat message and get response."""
         # Add user message
-        user_msg = Message(role="user", content=user_input)
-        self.memory.add_message(user_msg)
+        self.memory.add_message(Message.user(user_input))
         
         # Get tools for LLM
         tools = registry.get_tools_for_llm()
@@ -544,12 +666,12 @@ class AgentLoop:
                 self.memory.get_messages(),
                 tools=tools,
                 stream=False,
+                system_override=self.memory.system_text or None,
             )
             
             # Stop thinking
-            self.tui.stop_thinking()
-            await asyncio.sleep(0.1)  # Let the spinner stop
-            
+            await self._stop_thinking(thinking_task)
+
             # Update token usage
             if response.usage:
                 self.memory.update_token_usage(response.usage)
@@ -560,74 +682,57 @@ class AgentLoop:
             # Handle tool calls
             if response.tool_calls:
                 # Add assistant message with tool calls
-                assistant_msg = Message(
-                    role="assistant",
-                    content=response.content,
-                    tool_calls=response.tool_calls,
+                self.memory.add_message(
+                    Message.assistant(response.content, tool_calls=response.tool_calls)
                 )
-                self.memory.add_message(assistant_msg)
                 
                 # Process tools
                 tool_responses = await self._process_tool_calls(response.tool_calls)
                 for tr in tool_responses:
                     self.memory.add_message(tr)
                 
-                # Get follow-up response after tool use
-                self.tui.state.is_thinking = True
-                thinking_task = asyncio.create_task(
-                    self.tui.show_thinking("Processing results...")
-                )
-                
-                follow_up: LLMResponse = await self.client.chat(
+                # Stream the follow-up - it's rendered prose, so deltas go to
+                # the console as they arrive instead of buffering the full
+                # answer behind a spinner
+                stream = await self.client.chat(
                     self.memory.get_messages(),
                     tools=tools,
-                    stream=False,
+                    stream=True,
+                    system_override=self.memory.system_text or None,
                 )
-                
-                self.tui.stop_thinking()
-                await asyncio.sleep(0.1)
-                
-                # Render final response
-                if follow_up.content:
-                    self.tui.render_message(follow_up.content, role="assistant")
-                    self.memory.add_message(Message(
-                        role="assistant",
-                        content=follow_up.content,
-                    ))
+
+                follow_content = await self.tui.stream_response(stream)
+                if follow_content:
+                    self.memory.add_message(Message.assistant(follow_content))
             else:
                 # Regular response without tool calls
                 if response.content:
                     self.tui.render_message(response.content, role="assistant")
-                    self.memory.add_message(Message(
-                        role="assistant",
-                        content=response.content,
-                    ))
+                    self.memory.add_message(Message.assistant(response.content))
         
         except Exception as e:
             self.tui.stop_thinking()
             self.tui.render_error(str(e), title="Error")
         
         finally:
-            self.tui.stop_thinking()
-            if thinking_task and not thinking_task.done():
-                thinking_task.cancel()
-                try:
-                    await thinking_task
-                except asyncio.CancelledError:
-                    pass
-            
-            # Auto-extract and store memories from the exchange
+            await self._stop_thinking(thinking_task)
+
+            # Auto-extract and store memories from the exchange. This is a
+            # pure background job (often another LLM round-trip on the Mem0
+            # side), so it runs off the turn's critical path - the user can
+            # type again immediately
             if self.config.memory_auto_extract and self.memory_service.is_enabled:
                 # Get the last assistant response
-                messages = self.memory.get_messages()
-                assistant_responses = [m for m in messages if m.role == "assistant"]
-                if assistant_responses:
-                    last_response = assistant_responses[-1].content
-                    self.memory_service.extract_and_store(
+                last_response = self.memory.last_assistant_content()
+                if last_response is not None:
+                    task = asyncio.create_task(asyncio.to_thread(
+                        self.memory_service.extract_and_store,
                         user_input=user_input,
                         assistant_response=last_response,
                         user_id=self.config.memory_user_id,
-                    )
+                    ))
+                    self._bg_tasks.add(task)
+                    task.add_done_callback(self._bg_tasks.discard)
     
     async def run(self) -> None:
         """Main run loop."""
@@ -642,37 +747,48 @@ class AgentLoop:
         if issues:
             for issue in issues:
                 self.tui.render_error(issue, title="Configuration Issue")
-        
+
+        # Memory context loads while the user types their first prompt
+        memory_task = asyncio.create_task(self._load_memory_context())
+        self._bg_tasks.add(memory_task)
+        memory_task.add_done_callback(self._bg_tasks.discard)
+
+        # Double Ctrl+C within this window exits; tracked by timestamp so the
+        # handler never has to sleep
+        last_interrupt = 0.0
+        loop = asyncio.get_running_loop()
+
         # Main loop
         while self.running:
             try:
                 # Show footer
                 self.tui.render_footer()
-                
+
                 # Get user input
                 user_input = self.tui.render_input_prompt()
-                
+
                 if not user_input:
                     continue
-                
-                # Check for slash commands
-                if await self.commands.execute(user_input):
+
+                # Check for slash commands; plain chat input (the common
+                # case) skips the dispatch coroutine entirely
+                if user_input[0] in " \t/" and await self.commands.execute(user_input):
                     continue
-                
+
                 # Show user message
                 self.tui.render_message(user_input, role="user")
-                
+
                 # Process chat
                 await self._chat(user_input)
-            
+
             except KeyboardInterrupt:
-                self.tui.print("\n")
-                self.tui.render_info("Use /quit to exit or Ctrl+C again to force quit.")
-                try:
-                    await asyncio.sleep(0.5)
-                except KeyboardInterrupt:
+                now = loop.time()
+                if now - last_interrupt < 2.0:
                     break
-            
+                last_interrupt = now
+                self.tui.print("\n")
+                self.tui.render_info("Use /quit to exit or press Ctrl+C again to force quit.")
+
             except Exception as e:
                 self.tui.render_error(str(e), title="Unexpected Error")
         
@@ -728,8 +844,8 @@ def main(
         config.switch_model(model)
     
     if project:
-        from pathlib import Path
         config.project_root = Path(project).resolve()
+        invalidate_config_cache()
     
     # Create and run agent
     agent = AgentLoop(config=config, use_local=local)
@@ -5,16 +5,25 @@ Provides persistent, personalized memory layer for the AI agent.
 
 from __future__ import annotations
 
+import bisect
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from mem0 import MemoryClient
 
 from config import Config, get_config
 
+logger = logging.getLogger(__name__)
+
 
 class MemoryType(Enum):
     """Types of memories stored."""
@@ -23,7 +32,28 @@ class MemoryType(Enum):
     PROCEDURAL = "procedural"   # How-to knowledge & patterns
 
 
-@dataclass
+# Value -> member map; avoids paying a ValueError for unknown type strings
+_MEMORY_TYPES: dict[Any, MemoryType] = {t.value: t for t in MemoryType}
+
+@lru_cache(maxsize=64)
+def _filters_for(user_id: str) -> dict[str, str]:
+    """Filters dict, allocated once per user id.
+
+    Deliberately a plain dict: the SDK serializes it with json.dumps, which
+    rejects mappingproxy. Callers must treat it as read-only.
+    """
+    return {"user_id": user_id}
+
+
+# Display icon per memory type, built once instead of per context build
+_TYPE_ICONS: dict[MemoryType, str] = {
+    MemoryType.EPISODIC: "📅",
+    MemoryType.SEMANTIC: "💡",
+    MemoryType.PROCEDURAL: "⚙️",
+}
+
+
+@dataclass(slots=True)
 class Memory:
     """Represents a single memory."""
     id: str
@@ -31,27 +61,20 @@ class Memory:
     memory_type: MemoryType = MemoryType.EPISODIC
     created_at: datetime | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
-    
+
     @classmethod
     def from_mem0(cls, data: dict[str, Any]) -> Memory:
         """Create Memory from mem0 API response."""
-        memory_type = MemoryType.EPISODIC
-        if metadata := data.get("metadata", {}):
-            if type_str := metadata.get("type"):
-                try:
-                    memory_type = MemoryType(type_str)
-                except ValueError:
-                    pass
-        
+        metadata = data.get("metadata") or {}
         return cls(
             id=data.get("id", ""),
             content=data.get("memory", ""),
-            memory_type=memory_type,
-            metadata=data.get("metadata", {}),
+            memory_type=_MEMORY_TYPES.get(metadata.get("type"), MemoryType.EPISODIC),
+            metadata=metadata,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryService:
     """
     Persistent memory layer using Mem0.
@@ -62,12 +85,56 @@ class MemoryService:
     
     config: Config = field(default_factory=get_config)
     _client: MemoryClient | None = field(default=None, repr=False)
+    # Sorted memory-id index per user for prefix resolution; rebuilt lazily
+    # after any mutation
+    _id_index: dict[str, list[str]] = field(default_factory=dict, repr=False)
+    # Short-TTL cache for formatted memory context, so repeated lookups with
+    # the same query don't each pay a vector-search round-trip
+    _context_cache: dict[tuple[str, str, int], tuple[float, str]] = field(default_factory=dict, repr=False)
+    _context_ttl: float = 30.0
+    # Exact-match LRU over search results; every hit skips a Mem0 round-trip.
+    # Invalidated per-user on any mutation
+    _search_cache: OrderedDict[tuple[str, str, int], list[Memory]] = field(default_factory=OrderedDict, repr=False)
+    _search_cache_cap: int = 1000
+    _search_hits: int = field(default=0, repr=False)
+    _search_misses: int = field(default=0, repr=False)
+    # Shared pool so concurrent Mem0 reads don't pay thread startup each time
+    _executor: ThreadPoolExecutor | None = field(default=None, repr=False)
+    # Running per-user counts by memory type; seeded lazily from one get_all
+    # so get_stats avoids a network scan on every call
+    _type_counts: dict[str, dict[MemoryType, int]] = field(default_factory=dict, repr=False)
+    # Maps memory id -> (user_id, type) so delete() can decrement the right bucket
+    _id_owner_type: dict[str, tuple[str, MemoryType]] = field(default_factory=dict, repr=False)
+    # Guards every cache structure above: callers run on the context pool, on
+    # asyncio worker threads, and on the extract worker concurrently. Network
+    # calls never happen while it is held
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
     
     def __post_init__(self) -> None:
         """Initialize the mem0 client."""
         api_key = self.config.mem0_api_key
         if api_key:
             self._client = MemoryClient(api_key=api_key)
+            self._configure_transport(self._client)
+
+    @staticmethod
+    def _configure_transport(client: MemoryClient) -> None:
+        """Widen connection pooling on the SDK transport when it exposes one.
+
+        Each agent turn issues several small API calls; keeping connections
+        alive saves a TLS handshake per call, and a wider pool lets the
+        concurrent reads in get_memory_context share it.
+        """
+        session = getattr(client, "session", None) or getattr(client, "_session", None)
+        if session is None or not hasattr(session, "mount"):
+            return
+        try:
+            from requests.adapters import HTTPAdapter
+
+            session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+            session.headers.setdefault("Connection", "keep-alive")
+        except Exception as e:
+            logger.debug("Transport tuning skipped: %s", e)
     
     @property
     def is_enabled(self) -> bool:
@@ -75,8 +142,32 @@ class MemoryService:
         return self._client is not None and self.config.memory_enabled
     
     def _get_filters(self, user_id: str) -> dict[str, str]:
-        """Build filters dict for mem0 API calls."""
-        return {"user_id": user_id}
+        """Build filters mapping for mem0 API calls."""
+        return _filters_for(user_id)
+
+    def _invalidate(self, user_id: str | None = None) -> None:
+        """Drop cached lookups after a mutation.
+
+        With ``user_id`` only that user's entries go; without it (deletes
+        aren't scoped to a user) everything goes.
+        """
+        with self._lock:
+            if user_id is None:
+                self._id_index.clear()
+                self._search_cache.clear()
+                self._context_cache.clear()
+                return
+            self._id_index.pop(user_id, None)
+            for key in [k for k in self._search_cache if k[0] == user_id]:
+                del self._search_cache[key]
+            for key in [k for k in self._context_cache if k[1] == user_id]:
+                del self._context_cache[key]
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """Lazily create the shared executor for concurrent API reads."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mem0")
+        return self._executor
     
     # =========================================================================
     # Core Memory Operations
@@ -103,8 +194,18 @@ class MemoryService:
             return []
         
         user_id = user_id or self.config.memory_user_id
+
+        cache_key = (user_id, query, limit)
+        with self._lock:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                self._search_hits += 1
+                self._search_cache.move_to_end(cache_key)
+                return list(cached)
+            self._search_misses += 1
+
         filters = self._get_filters(user_id)
-        
+
         try:
             result = self._client.search(
                 query=query,
@@ -113,13 +214,16 @@ class MemoryService:
                 filters=filters,
             )
             
-            memories = []
-            for item in result.get("results", []):
-                memories.append(Memory.from_mem0(item))
-            return memories
-            
+            memories = [Memory.from_mem0(item) for item in result.get("results", ())]
+            with self._lock:
+                self._id_owner_type.update((m.id, (user_id, m.memory_type)) for m in memories)
+                self._search_cache[cache_key] = memories
+                while len(self._search_cache) > self._search_cache_cap:
+                    self._search_cache.popitem(last=False)
+            return list(memories)
+
         except Exception as e:
-            print(f"[Memory] Search error: {e}")
+            logger.exception("Search error: %s", e)
             return []
     
     def get_all(
@@ -149,13 +253,13 @@ class MemoryService:
                 filters=filters,
             )
             
-            memories = []
-            for item in result.get("results", [])[:limit]:
-                memories.append(Memory.from_mem0(item))
+            memories = [Memory.from_mem0(item) for item in result.get("results", ())[:limit]]
+            with self._lock:
+                self._id_owner_type.update((m.id, (user_id, m.memory_type)) for m in memories)
             return memories
             
         except Exception as e:
-            print(f"[Memory] Get all error: {e}")
+            logger.exception("Get all error: %s", e)
             return []
     
     def add(
@@ -193,10 +297,14 @@ class MemoryService:
                 user_id=user_id,
                 metadata=mem_metadata,
             )
+            self._invalidate(user_id)
+            with self._lock:
+                if (counts := self._type_counts.get(user_id)) is not None:
+                    counts[memory_type] += 1
             return True
             
         except Exception as e:
-            print(f"[Memory] Add error: {e}")
+            logger.exception("Add error: %s", e)
             return False
     
     def add_text(
@@ -231,12 +339,56 @@ class MemoryService:
                     "timestamp": datetime.now().isoformat(),
                 },
             )
+            self._invalidate(user_id)
+            with self._lock:
+                if (counts := self._type_counts.get(user_id)) is not None:
+                    counts[memory_type] += 1
             return True
             
         except Exception as e:
-            print(f"[Memory] Add text error: {e}")
+            logger.exception("Add text error: %s", e)
             return False
     
+    def resolve_prefix(
+        self,
+        partial_id: str,
+        user_id: str | None = None,
+    ) -> str | None:
+        """
+        Resolve a memory-id prefix to the unique full ID.
+
+        A sorted per-user index makes this a bisect instead of a linear scan
+        over every memory.
+
+        Args:
+            partial_id: Leading characters of the memory ID
+            user_id: User identifier (defaults to config)
+
+        Returns:
+            The full memory ID, or None if nothing matches
+
+        Raises:
+            ValueError: If the prefix matches more than one memory
+        """
+        if not self.is_enabled or not partial_id:
+            return None
+
+        user_id = user_id or self.config.memory_user_id
+        with self._lock:
+            ids = self._id_index.get(user_id)
+        if ids is None:
+            # Fetch outside the lock; get_all takes it for its own bookkeeping
+            ids = sorted(m.id for m in self.get_all(user_id=user_id, limit=100))
+            with self._lock:
+                self._id_index[user_id] = ids
+
+        i = bisect.bisect_left(ids, partial_id)
+        if i == len(ids) or not ids[i].startswith(partial_id):
+            return None
+        if ids[i] != partial_id and i + 1 < len(ids) and ids[i + 1].startswith(partial_id):
+            raise ValueError(f"Ambiguous memory ID prefix: {partial_id}")
+        return ids[i]
+
     def delete(self, memory_id: str) -> bool:
         """
         Delete a specific memory by ID.
@@ -252,9 +404,17 @@ class MemoryService:
         
         try:
             self._client.delete(memory_id=memory_id)
+            self._invalidate()
+            with self._lock:
+                owner = self._id_owner_type.pop(memory_id, None)
+                if owner is not None:
+                    if (counts := self._type_counts.get(owner[0])) is not None:
+                        counts[owner[1]] -= 1
+                else:
+                    self._type_counts.clear()  # unknown owner: reseed on next get_stats
             return True
         except Exception as e:
-            print(f"[Memory] Delete error: {e}")
+            logger.exception("Delete error: %s", e)
             return False
     
     def delete_all(self, user_id: str | None = None) -> bool:
@@ -274,9 +434,12 @@ class MemoryService:
         
         try:
             self._client.delete_all(user_id=user_id)
+            self._invalidate(user_id)
+            with self._lock:
+                self._type_counts.pop(user_id, None)
             return True
         except Exception as e:
-            print(f"[Memory] Delete all error: {e}")
+            logger.exception("Delete all error: %s", e)
             return False
     
     # =========================================================================
@@ -305,30 +468,35 @@ class MemoryService:
         """
         if not self.is_enabled:
             return ""
-        
+
         user_id = user_id or self.config.memory_user_id
-        
-        # First try semantic search
-        memories = self.search(query, user_id=user_id, limit=max_memories)
-        
-        # Fallback to recent memories if search returns nothing
-        if not memories:
-            memories = self.get_all(user_id=user_id, limit=max_memories)
-        
+
+        cache_key = (query, user_id, max_memories)
+        with self._lock:
+            cached = self._context_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._context_ttl:
+            return cached[1]
+
+        # Issue the semantic search and the recency fallback together, so a
+        # search miss costs max(t_search, t_get_all) instead of their sum
+        pool = self._pool()
+        search_future = pool.submit(self.search, query, user_id=user_id, limit=max_memories)
+        recent_future = pool.submit(self.get_all, user_id=user_id, limit=max_memories)
+
+        memories = search_future.result() or recent_future.result()
+
         if not memories:
+            with self._lock:
+                self._context_cache[cache_key] = (time.monotonic(), "")
             return ""
-        
+
         # Format memories for context
-        lines = []
-        for mem in memories:
-            type_icon = {
-                MemoryType.EPISODIC: "📅",
-                MemoryType.SEMANTIC: "💡", 
-                MemoryType.PROCEDURAL: "⚙️",
-            }.get(mem.memory_type, "•")
-            lines.append(f"{type_icon} {mem.content}")
-        
-        return "\n".join(lines)
+        context = "\n".join(
+            f"{_TYPE_ICONS.get(mem.memory_type, '•')} {mem.content}" for mem in memories
+        )
+        with self._lock:
+            self._context_cache[cache_key] = (time.monotonic(), context)
+        return context
     
     def extract_and_store(
         self,
@@ -374,18 +542,30 @@ class MemoryService:
             return {"enabled": False}
         
         user_id = user_id or self.config.memory_user_id
-        memories = self.get_all(user_id=user_id, limit=100)
-        
-        # Count by type
-        type_counts = {t: 0 for t in MemoryType}
-        for mem in memories:
-            type_counts[mem.memory_type] += 1
-        
+
+        # Seed the running counters once, then serve subsequent calls without
+        # refetching every memory
+        with self._lock:
+            counts = self._type_counts.get(user_id)
+        if counts is None:
+            counts = {t: 0 for t in MemoryType}
+            for mem in self.get_all(user_id=user_id, limit=100):
+                counts[mem.memory_type] += 1
+            with self._lock:
+                self._type_counts[user_id] = counts
+
+        lookups = self._search_hits + self._search_misses
         return {
             "enabled": True,
             "user_id": user_id,
-            "total_memories": len(memories),
-            "by_type": {t.value: count for t, count in type_counts.items()},
+            "total_memories": sum(counts.values()),
+            "by_type": {t.value: count for t, count in counts.items()},
+            "search_cache": {
+                "size": len(self._search_cache),
+                "hits": self._search_hits,
+                "misses": self._search_misses,
+                "hit_rate": self._search_hits / lookups if lookups else 0.0,
+            },
         }
 
 
@@ -5,14 +5,26 @@ Decorator-based tool registry for file system operations and web search.
 
 from __future__ import annotations
 
-import json
+import inspect
 import os
+import shlex
+import signal
 import subprocess
+import threading
+import time
 from dataclasses import dataclass, field
-from functools import wraps
+from functools import lru_cache, wraps
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable, TypeVar
 
+# orjson parses tool arguments a few times faster than stdlib json; both
+# raise a ValueError subclass on bad input
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Try to import duckduckgo_search, fallback to stub if not available
 try:
     from duckduckgo_search import DDGS
@@ -34,7 +46,18 @@ from config import get_config
 F = TypeVar("F", bound=Callable[..., str])
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _project_root() -> Path:
+    """Configured project root, resolved once rather than per tool call."""
+    return get_config().project_root
+
+
+def invalidate_config_cache() -> None:
+    """Forget the cached project root (call after reassigning it)."""
+    _project_root.cache_clear()
+
+
+@dataclass(slots=True)
 class ToolParameter:
     """Definition of a tool parameter."""
     name: str
@@ -44,19 +67,30 @@ class ToolParameter:
     default: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Tool:
     """Represents a registered tool."""
     name: str
     description: str
     function: Callable[..., str]
     parameters: list[ToolParameter] = field(default_factory=list)
-    
+    # Network-bound tools are launched first under a contended dispatcher so
+    # their round-trips overlap local work
+    is_io_bound: bool = False
+    # Parameters never change after construction, so the schema is built once
+    _schema_cache: dict[str, Any] | None = field(default=None, init=False, repr=False)
+    # Names the function actually accepts, captured once at registration so
+    # dispatch can drop hallucinated arguments without paying a TypeError
+    _arg_names: frozenset[str] | None = field(default=None, init=False, repr=False)
+
     def to_json_schema(self) -> dict[str, Any]:
         """Convert to JSON Schema format for LLM function calling."""
+        if self._schema_cache is not None:
+            return self._schema_cache
+
         properties = {}
         required = []
-        
+
         for param in self.parameters:
             properties[param.name] = {
                 "type": param.type,
@@ -64,12 +98,13 @@ class Tool:
             }
             if param.required:
                 required.append(param.name)
-        
-        return {
+
+        self._schema_cache = {
             "type": "object",
             "properties": properties,
             "required": required,
         }
+        return self._schema_cache
     
     def execute(self, **kwargs: Any) -> str:
         """Execute the tool with given arguments."""
@@ -82,23 +117,16 @@ class ToolRegistry:
     Tools are registered using the @tool decorator.
     """
     
-    _instance: ToolRegistry | None = None
-    
-    def __new__(cls) -> ToolRegistry:
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._tools = {}
-        return cls._instance
-    
     def __init__(self) -> None:
-        if not hasattr(self, "_tools"):
-            self._tools: dict[str, Tool] = {}
+        self._tools: dict[str, Tool] = {}
+        self._llm_tools_cache: list[Any] | None = None
     
     def register(
         self,
         name: str,
         description: str,
         parameters: list[ToolParameter] | None = None,
+        is_io_bound: bool = False,
     ) -> Callable[[F], F]:
         """
         Decorator to register a tool.
@@ -114,9 +142,16 @@ class ToolRegistry:
                 description=description,
                 function=func,
                 parameters=parameters or [],
+                is_io_bound=is_io_bound,
             )
+            tool.to_json_schema()  # warm the schema cache at registration
+            try:
+                tool._arg_names = frozenset(inspect.signature(func).parameters)
+            except (TypeError, ValueError):
+                pass  # uninspectable callable: dispatch passes kwargs through
             self._tools[name] = tool
-            
+            self._llm_tools_cache = None
+
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> str:
                 return func(*args, **kwargs)
@@ -128,15 +163,27 @@ class ToolRegistry:
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
         return self._tools.get(name)
+
+    def is_io_bound(self, name: str) -> bool:
+        """Whether a tool spends its time waiting on the network."""
+        tool = self._tools.get(name)
+        return tool is not None and tool.is_io_bound
     
     def execute(self, name: str, **kwargs: Any) -> str:
         """Execute a tool by name."""
-        tool = self.get(name)
+        tool = self._tools.get(name)
         if tool is None:
             return f"Error: Tool '{name}' not found."
-        
+
+        # Drop arguments the function doesn't accept; the keys check is a
+        # fast set comparison so well-formed calls pay nothing extra
+        accepted = tool._arg_names
+        if accepted is not None and not kwargs.keys() <= accepted:
+            kwargs = {k: v for k, v in kwargs.items() if k in accepted}
+
         try:
-            return tool.execute(**kwargs)
+            # Call the function directly; Tool.execute is just a pass-through
+            return tool.function(**kwargs)
         except Exception as e:
             return f"Error executing '{name}': {str(e)}"
     
@@ -144,29 +191,43 @@ class ToolRegistry:
         """List all registered tools."""
         return list(self._tools.values())
     
-    def get_tools_for_llm(self) -> list[dict[str, Any]]:
-        """Get tools in format suitable for LLM function calling."""
-        from llm_client import ToolDefinition
-        
-        return [
-            ToolDefinition(
-                name=tool.name,
-                description=tool.description,
-                parameters=tool.to_json_schema(),
-                function=tool.function,
-            )
-            for tool in self._tools.values()
-        ]
-    
+    def get_tools_for_llm(self) -> list[Any]:
+        """Get tools in format suitable for LLM function calling.
+
+        The registry is static once modules are imported, so the schema
+        conversion runs once and callers get the same list (and the same
+        ToolDefinition objects) every turn - which also lets the clients'
+        identity-keyed tool caches hit.
+        """
+        if self._llm_tools_cache is None:
+            from llm_client import ToolDefinition
+
+            self._llm_tools_cache = [
+                ToolDefinition(
+                    name=tool.name,
+                    description=tool.description,
+                    parameters=tool.to_json_schema(),
+                    function=tool.function,
+                )
+                for tool in self._tools.values()
+            ]
+        return self._llm_tools_cache
+
     def clear(self) -> None:
         """Clear all registered tools."""
         self._tools.clear()
+        self._llm_tools_cache = None
 
 
-# Global registry instance
+# Global registry instance - the one place a ToolRegistry is constructed
 registry = ToolRegistry()
 
 
+def get_registry() -> ToolRegistry:
+    """Return the shared registry instance."""
+    return registry
+
+
 # ============================================================================
 # Helper function for the decorator shorthand
 # ============================================================================
@@ -175,6 +236,7 @@ def tool(
     name: str,
     description: str,
     parameters: list[ToolParameter] | None = None,
+    is_io_bound: bool = False,
 ) -> Callable[[F], F]:
     """
     Shorthand decorator for registering tools.
@@ -184,13 +246,29 @@ def tool(
         def list_files(path: str = ".") -> str:
             ...
     """
-    return registry.register(name, description, parameters)
+    return registry.register(name, description, parameters, is_io_bound=is_io_bound)
 
 
 # ============================================================================
 # File System Tools
 # ============================================================================
 
+def _truncate(s: str, n: int) -> str:
+    """Clip ``s`` to ``n`` chars with an ellipsis marker; no-op when short."""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+def _fmt_size(n: int) -> str:
+    """Format a byte count compactly; shifts instead of divisions."""
+    bl = n.bit_length()
+    if bl >= 31:
+        return f"{n >> 30}GB"
+    if bl >= 21:
+        return f"{n >> 20}MB"
+    if bl >= 11:
+        return f"{n >> 10}KB"
+    return f"{n}B"
+
 @tool(
     "ls",
     "List files and directories in the specified path. Returns a formatted list of contents.",
@@ -214,12 +292,11 @@ def tool(
 def list_files(path: str = ".", show_hidden: bool = False) -> str:
     """List files in a directory."""
     try:
-        config = get_config()
         target_path = Path(path)
-        
+
         # Make relative paths relative to project root
         if not target_path.is_absolute():
-            target_path = config.project_root / target_path
+            target_path = _project_root() / target_path
         
         if not target_path.exists():
             return f"Error: Path '{path}' does not exist."
@@ -227,24 +304,20 @@ def list_files(path: str = ".", show_hidden: bool = False) -> str:
         if not target_path.is_dir():
             return f"Error: '{path}' is not a directory."
         
-        entries = []
-        for entry in sorted(target_path.iterdir()):
-            # Skip hidden files unless requested
-            if not show_hidden and entry.name.startswith("."):
-                continue
-            
-            entry_type = "📁" if entry.is_dir() else "📄"
-            size = ""
-            if entry.is_file():
-                size_bytes = entry.stat().st_size
-                if size_bytes < 1024:
-                    size = f" ({size_bytes}B)"
-                elif size_bytes < 1024 * 1024:
-                    size = f" ({size_bytes // 1024}KB)"
-                else:
-                    size = f" ({size_bytes // (1024 * 1024)}MB)"
-            
-            entries.append(f"{entry_type} {entry.name}{size}")
+        # scandir caches stat/is_dir/is_file from one directory read, so we
+        # avoid a separate stat syscall per entry
+        with os.scandir(target_path) as it:
+            raw_entries = sorted(it, key=lambda e: e.name)
+
+        # One comprehension keeps the per-entry work in a single specialized
+        # loop: no append lookups, no temporaries, hidden-file filter inline
+        entries = [
+            f"📄 {e.name} ({_fmt_size(e.stat(follow_symlinks=False).st_size)})"
+            if e.is_file(follow_symlinks=False)
+            else f"{'📁' if e.is_dir(follow_symlinks=False) else '📄'} {e.name}"
+            for e in raw_entries
+            if show_hidden or not e.name.startswith(".")
+        ]
         
         if not entries:
             return f"Directory '{path}' is empty."
@@ -292,12 +365,11 @@ def read_file(
 ) -> str:
     """Read the contents of a file."""
     try:
-        config = get_config()
         target_path = Path(filepath)
-        
+
         # Make relative paths relative to project root
         if not target_path.is_absolute():
-            target_path = config.project_root / target_path
+            target_path = _project_root() / target_path
         
         if not target_path.exists():
             return f"Error: File '{filepath}' does not exist."
@@ -305,27 +377,23 @@ def read_file(
         if not target_path.is_file():
             return f"Error: '{filepath}' is not a file."
         
-        # Read the file
-        content = target_path.read_text(encoding="utf-8")
-        lines = content.splitlines(keepends=True)
-        
-        # Apply line range if specified
-        if start_line is not None or end_line is not None:
-            start_idx = (start_line - 1) if start_line else 0
-            end_idx = end_line if end_line else len(lines)
-            
-            if start_idx < 0:
-                start_idx = 0
-            if end_idx > len(lines):
-                end_idx = len(lines)
-            
-            lines = lines[start_idx:end_idx]
-            
-            # Add line numbers
-            numbered_lines = []
-            for i, line in enumerate(lines, start=start_idx + 1):
-                numbered_lines.append(f"{i:4d} | {line.rstrip()}")
-            content = "\n".join(numbered_lines)
+        # Read the file; for ranged reads, stream and materialize only the
+        # requested slice instead of splitting the whole file into a list
+        if start_line is None and end_line is None:
+            content = target_path.read_text(encoding="utf-8")
+        else:
+            start_idx = max(0, (start_line or 1) - 1)
+            stop = end_line
+            if stop is not None and stop < start_idx:
+                stop = start_idx
+
+            with open(target_path, encoding="utf-8") as f:
+                lines = list(islice(f, start_idx, stop))
+
+            content = "\n".join(
+                f"{i:4d} | {line.rstrip()}"
+                for i, line in enumerate(lines, start=start_idx + 1)
+            )
         
         # Truncate if too long
         max_length = 10000
@@ -374,12 +442,11 @@ def write_file(
 ) -> str:
     """Create or overwrite a file with content."""
     try:
-        config = get_config()
         target_path = Path(filepath)
-        
+
         # Make relative paths relative to project root
         if not target_path.is_absolute():
-            target_path = config.project_root / target_path
+            target_path = _project_root() / target_path
         
         # Create parent directories if needed
         if create_dirs:
@@ -387,16 +454,22 @@ def write_file(
         elif not target_path.parent.exists():
             return f"Error: Parent directory '{target_path.parent}' does not exist."
         
-        # Check if file exists (for messaging)
-        file_existed = target_path.exists()
-        
-        # Write the file
-        target_path.write_text(content, encoding="utf-8")
-        
-        action = "Updated" if file_existed else "Created"
+        # One open classifies Created vs Updated - no separate exists() stat
+        data = content.encode("utf-8")
+        try:
+            fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            action = "Created"
+        except FileExistsError:
+            fd = os.open(target_path, os.O_WRONLY | os.O_TRUNC)
+            action = "Updated"
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
         line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
-        
-        return f"{action} file: {target_path}\nLines: {line_count}, Size: {len(content)} bytes"
+
+        return f"{action} file: {target_path}\nLines: {line_count}, Size: {len(data)} bytes"
     
     except PermissionError:
         return f"Error: Permission denied to write '{filepath}'."
@@ -425,24 +498,28 @@ def write_file(
 def append_file(filepath: str, content: str) -> str:
     """Append content to a file."""
     try:
-        config = get_config()
         target_path = Path(filepath)
-        
+
         if not target_path.is_absolute():
-            target_path = config.project_root / target_path
+            target_path = _project_root() / target_path
         
         # Create parent directories if needed
         target_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Check if file exists
-        file_existed = target_path.exists()
-        
-        # Append to file
-        with open(target_path, "a", encoding="utf-8") as f:
-            f.write(content)
-        
-        action = "Appended to" if file_existed else "Created"
-        return f"{action} file: {target_path}\nAppended: {len(content)} bytes"
+        # One open classifies Created vs Appended - no separate exists() stat
+        data = content.encode("utf-8")
+        try:
+            fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_EXCL, 0o666)
+            action = "Created"
+        except FileExistsError:
+            fd = os.open(target_path, os.O_WRONLY | os.O_APPEND)
+            action = "Appended to"
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+        return f"{action} file: {target_path}\nAppended: {len(data)} bytes"
     
     except Exception as e:
         return f"Error appending to file: {str(e)}"
@@ -463,19 +540,18 @@ def append_file(filepath: str, content: str) -> str:
 def delete_file(filepath: str) -> str:
     """Delete a file."""
     try:
-        config = get_config()
         target_path = Path(filepath)
-        
+
         if not target_path.is_absolute():
-            target_path = config.project_root / target_path
+            target_path = _project_root() / target_path
         
-        if not target_path.exists():
+        try:
+            target_path.unlink()
+        except FileNotFoundError:
             return f"Error: File '{filepath}' does not exist."
-        
-        if not target_path.is_file():
+        except IsADirectoryError:
             return f"Error: '{filepath}' is not a file."
-        
-        target_path.unlink()
+
         return f"Deleted file: {target_path}"
     
     except PermissionError:
@@ -488,6 +564,21 @@ def delete_file(filepath: str) -> str:
 # Shell Command Tool
 # ============================================================================
 
+# Per-stream cap on captured output so chatty commands stay bounded
+_OUTPUT_CAP = 1 << 20
+
+
+def _needs_shell(command: str) -> bool:
+    """Whether the command uses shell syntax that a plain exec cannot handle.
+
+    Covers metacharacters, tilde expansion, multi-line scripts, and leading
+    VAR=value environment assignments.
+    """
+    if any(c in command for c in "|&;<>$`*?(){}[]~\n"):
+        return True
+    first = command.split(None, 1)[0] if command.strip() else ""
+    return "=" in first
+
 @tool(
     "run_command",
     "Execute a shell command and return the output. Use with caution.",
@@ -521,41 +612,64 @@ def run_command(
 ) -> str:
     """Execute a shell command."""
     try:
-        config = get_config()
-        
+        root = _project_root()
+
         # Set working directory
-        working_dir = Path(cwd) if cwd else config.project_root
+        working_dir = Path(cwd) if cwd else root
         if not working_dir.is_absolute():
-            working_dir = config.project_root / working_dir
+            working_dir = root / working_dir
         
-        # Execute command
-        result = subprocess.run(
-            command,
-            shell=True,
+        # Only pay for a shell when the command actually uses shell syntax
+        use_shell = _needs_shell(command)
+        if use_shell:
+            argv: str | list[str] = command
+        else:
+            try:
+                argv = shlex.split(command)
+            except ValueError:
+                argv, use_shell = command, True
+
+        # start_new_session puts the command (and any shell children) in its
+        # own process group so a timeout kill reaches all of them
+        proc = subprocess.Popen(
+            argv,
+            shell=use_shell,
             cwd=working_dir,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout,
+            start_new_session=True,
         )
-        
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                proc.kill()
+            proc.communicate()
+            return f"Error: Command timed out after {timeout} seconds."
+
         output_parts = []
-        
-        if result.stdout:
-            output_parts.append(f"STDOUT:\n{result.stdout}")
-        
-        if result.stderr:
-            output_parts.append(f"STDERR:\n{result.stderr}")
-        
-        if result.returncode != 0:
-            output_parts.append(f"Exit code: {result.returncode}")
-        
+
+        if stdout:
+            if len(stdout) > _OUTPUT_CAP:
+                stdout = stdout[:_OUTPUT_CAP] + "\n... (truncated)"
+            output_parts.append(f"STDOUT:\n{stdout}")
+
+        if stderr:
+            if len(stderr) > _OUTPUT_CAP:
+                stderr = stderr[:_OUTPUT_CAP] + "\n... (truncated)"
+            output_parts.append(f"STDERR:\n{stderr}")
+
+        if proc.returncode != 0:
+            output_parts.append(f"Exit code: {proc.returncode}")
+
         if not output_parts:
             return "Command executed successfully (no output)."
-        
+
         return "\n\n".join(output_parts)
-    
-    except subprocess.TimeoutExpired:
-        return f"Error: Command timed out after {timeout} seconds."
+
     except Exception as e:
         return f"Error executing command: {str(e)}"
 
@@ -564,6 +678,59 @@ def run_command(
 # Web Search Tool
 # ============================================================================
 
+# Agents repeat identical queries often enough that a short-TTL cache keyed
+# on (provider, normalized query, max_results) skips the whole HTTPS round-trip.
+# Tool calls run on worker threads, so all access goes through the lock -
+# the eviction scan in particular must not race a concurrent insert
+_SEARCH_CACHE: dict[tuple[str, str, int], tuple[float, str]] = {}
+_SEARCH_CACHE_CAP = 256
+_SEARCH_TTL = 600.0
+_SEARCH_MAX_QUERY_LEN = 512  # don't admit pathological keys
+_search_lock = threading.Lock()
+
+
+# Reused DDGS session so repeat searches share one connection pool instead of
+# a fresh TLS handshake per query; recycled periodically to shed cookie bloat.
+# Tool calls run on worker threads, hence the lock
+_ddgs: Any = None
+_ddgs_uses = 0
+_DDGS_RECYCLE_AFTER = 50
+_ddgs_lock = threading.Lock()
+
+
+def _get_ddgs() -> Any:
+    global _ddgs, _ddgs_uses
+    with _ddgs_lock:
+        if _ddgs is None or _ddgs_uses >= _DDGS_RECYCLE_AFTER:
+            old, _ddgs, _ddgs_uses = _ddgs, DDGS(), 0
+            if old is not None:
+                try:
+                    old.close()
+                except Exception:
+                    pass
+        _ddgs_uses += 1
+        return _ddgs
+
+
+def _cached_search(provider: str, query: str, max_results: int) -> str | None:
+    """Return a fresh cached result for this search, or None."""
+    with _search_lock:
+        hit = _SEARCH_CACHE.get((provider, query.strip().lower(), max_results))
+    if hit is not None and time.monotonic() - hit[0] < _SEARCH_TTL:
+        return hit[1]
+    return None
+
+
+def _store_search(provider: str, query: str, max_results: int, result: str) -> None:
+    """Admit a successful search result into the cache."""
+    if len(query) > _SEARCH_MAX_QUERY_LEN:
+        return
+    with _search_lock:
+        if len(_SEARCH_CACHE) >= _SEARCH_CACHE_CAP:
+            oldest = min(_SEARCH_CACHE, key=lambda k: _SEARCH_CACHE[k][0])
+            del _SEARCH_CACHE[oldest]
+        _SEARCH_CACHE[(provider, query.strip().lower(), max_results)] = (time.monotonic(), result)
+
 @tool(
     "web_search",
     "Search the web for information using DuckDuckGo.",
@@ -582,6 +749,7 @@ def run_command(
             default=5,
         ),
     ],
+    is_io_bound=True,
 )
 def web_search(query: str, max_results: int = 5) -> str:
     """Search the web using DuckDuckGo."""
@@ -591,26 +759,29 @@ def web_search(query: str, max_results: int = 5) -> str:
             "Install duckduckgo-search: pip install duckduckgo-search"
         )
     
+    cached = _cached_search("ddg", query, max_results)
+    if cached is not None:
+        return cached
+
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=max_results))
-        
+        results = list(_get_ddgs().text(query, max_results=max_results))
+
         if not results:
             return f"No results found for: {query}"
-        
+
+        # One entry per result keeps the join over a short list
         output = [f"Search results for: {query}\n"]
-        
-        for i, result in enumerate(results, 1):
-            title = result.get("title", "No title")
-            url = result.get("href", result.get("link", "No URL"))
-            snippet = result.get("body", result.get("snippet", "No description"))
-            
-            output.append(f"{i}. **{title}**")
-            output.append(f"   URL: {url}")
-            output.append(f"   {snippet}\n")
-        
-        return "\n".join(output)
-    
+        output.extend(
+            f"{i}. **{result.get('title', 'No title')}**\n"
+            f"   URL: {result.get('href', result.get('link', 'No URL'))}\n"
+            f"   {result.get('body', result.get('snippet', 'No description'))}\n"
+            for i, result in enumerate(results, 1)
+        )
+
+        formatted = "\n".join(output)
+        _store_search("ddg", query, max_results, formatted)
+        return formatted
+
     except Exception as e:
         return f"Error searching the web: {str(e)}"
 
@@ -619,6 +790,21 @@ def web_search(query: str, max_results: int = 5) -> str:
 # Tavily Search Tool
 # ============================================================================
 
+# Long-lived client so repeat searches reuse one TCP+TLS connection instead
+# of handshaking per call; rebuilt only if the API key changes
+_tavily_client: Any = None
+_tavily_client_key: str | None = None
+_tavily_lock = threading.Lock()
+
+
+def _get_tavily_client(api_key: str) -> Any:
+    global _tavily_client, _tavily_client_key
+    with _tavily_lock:
+        if _tavily_client is None or _tavily_client_key != api_key:
+            _tavily_client = TavilyClient(api_key=api_key)
+            _tavily_client_key = api_key
+        return _tavily_client
+
 @tool(
     "tavily_search",
     "Search the web using Tavily AI-powered search engine. Returns comprehensive, high-quality search results.",
@@ -637,6 +823,7 @@ def web_search(query: str, max_results: int = 5) -> str:
             default=5,
         ),
     ],
+    is_io_bound=True,
 )
 def tavily_search(query: str, max_results: int = 5) -> str:
     """Search the web using Tavily AI-powered search."""
@@ -646,34 +833,37 @@ def tavily_search(query: str, max_results: int = 5) -> str:
             "Install tavily-python: pip install tavily-python"
         )
     
+    cached = _cached_search("tavily", query, max_results)
+    if cached is not None:
+        return cached
+
     try:
         config = get_config()
         api_key = config.tavily_api_key
-        
+
         if not api_key:
             return "Error: TAVILY_API_KEY is not set in .env file."
-        
-        client = TavilyClient(api_key=api_key)
+
+        client = _get_tavily_client(api_key)
         response = client.search(query=query, max_results=max_results)
-        
+
         results = response.get("results", [])
-        
+
         if not results:
             return f"No results found for: {query}"
-        
+
         output = [f"Tavily search results for: {query}\n"]
-        
-        for i, result in enumerate(results, 1):
-            title = result.get("title", "No title")
-            url = result.get("url", "No URL")
-            content = result.get("content", "No description")
-            
-            output.append(f"{i}. **{title}**")
-            output.append(f"   URL: {url}")
-            output.append(f"   {content[:300]}...\n" if len(content) > 300 else f"   {content}\n")
-        
-        return "\n".join(output)
-    
+        output.extend(
+            f"{i}. **{result.get('title', 'No title')}**\n"
+            f"   URL: {result.get('url', 'No URL')}\n"
+            f"   {_truncate(result.get('content', 'No description'), 300)}\n"
+            for i, result in enumerate(results, 1)
+        )
+
+        formatted = "\n".join(output)
+        _store_search("tavily", query, max_results, formatted)
+        return formatted
+
     except Exception as e:
         return f"Error searching with Tavily: {str(e)}"
 
@@ -682,6 +872,19 @@ def tavily_search(query: str, max_results: int = 5) -> str:
 # Project Context Tools
 # ============================================================================
 
+# Tree output keyed on (root, depth, hidden, root mtime). The root mtime
+# changes whenever top-level entries are added or removed, which catches the
+# common invalidation; the hit path is one stat instead of a full walk
+_TREE_CACHE: dict[tuple[str, int, bool, int], str] = {}
+_TREE_CACHE_CAP = 8
+
+# Directories never descended into; pruned before they are pushed on the walk
+# stack, so their contents are never even scanned
+_SKIP_DIRS = frozenset({
+    "__pycache__", "node_modules", ".git", ".venv", "venv",
+    "dist", "build", ".cache", ".pytest_cache", "htmlcov",
+})
+
 @tool(
     "get_project_structure",
     "Get the project directory structure as a tree.",
@@ -705,52 +908,62 @@ def tavily_search(query: str, max_results: int = 5) -> str:
 def get_project_structure(max_depth: int = 3, include_hidden: bool = False) -> str:
     """Get the project directory structure."""
     try:
-        config = get_config()
-        root = config.project_root
-        
-        # Common directories to skip
-        skip_dirs = {
-            "__pycache__", "node_modules", ".git", ".venv", "venv",
-            "dist", "build", ".cache", ".pytest_cache", "htmlcov",
-        }
-        
-        def build_tree(path: Path, prefix: str = "", depth: int = 0) -> list[str]:
+        root = _project_root()
+
+        try:
+            root_mtime = os.stat(root).st_mtime_ns
+        except OSError:
+            root_mtime = -1
+        cache_key = (str(root), max_depth, include_hidden, root_mtime)
+        cached = _TREE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        tree_lines = [f"📂 {root.name}/"]
+        # Explicit stack instead of recursion; scandir's DirEntry answers
+        # is_dir from the directory read itself, so no per-entry stat
+        stack: list[tuple[os.DirEntry[str], str, bool, int]] = []
+
+        def push_children(path: Any, prefix: str, depth: int) -> None:
             if depth >= max_depth:
-                return []
-            
-            lines = []
-            
+                return
             try:
-                entries = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
+                with os.scandir(path) as it:
+                    entries = sorted(
+                        it, key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower())
+                    )
             except PermissionError:
-                return [f"{prefix}[Permission denied]"]
-            
-            # Filter entries
-            filtered = []
-            for entry in entries:
-                if not include_hidden and entry.name.startswith("."):
-                    continue
-                if entry.is_dir() and entry.name in skip_dirs:
-                    continue
-                filtered.append(entry)
-            
-            for i, entry in enumerate(filtered):
-                is_last = i == len(filtered) - 1
-                connector = "└── " if is_last else "├── "
-                
-                icon = "📁 " if entry.is_dir() else "📄 "
-                lines.append(f"{prefix}{connector}{icon}{entry.name}")
-                
-                if entry.is_dir():
-                    extension = "    " if is_last else "│   "
-                    lines.extend(build_tree(entry, prefix + extension, depth + 1))
-            
-            return lines
-        
-        tree_lines = [f"📂 {root.name}/"]
-        tree_lines.extend(build_tree(root))
-        
-        return "\n".join(tree_lines)
+                tree_lines.append(f"{prefix}[Permission denied]")
+                return
+
+            filtered = [
+                e for e in entries
+                if (include_hidden or not e.name.startswith("."))
+                and not (e.is_dir(follow_symlinks=False) and e.name in _SKIP_DIRS)
+            ]
+
+            # Reverse push so pops come out in display order
+            last = len(filtered) - 1
+            for i in range(last, -1, -1):
+                stack.append((filtered[i], prefix, i == last, depth))
+
+        push_children(root, "", 0)
+        while stack:
+            entry, prefix, is_last, depth = stack.pop()
+            connector = "└── " if is_last else "├── "
+
+            if entry.is_dir(follow_symlinks=False):
+                tree_lines.append(f"{prefix}{connector}📁 {entry.name}")
+                extension = "    " if is_last else "│   "
+                push_children(entry.path, prefix + extension, depth + 1)
+            else:
+                tree_lines.append(f"{prefix}{connector}📄 {entry.name}")
+
+        result = "\n".join(tree_lines)
+        if len(_TREE_CACHE) >= _TREE_CACHE_CAP:
+            _TREE_CACHE.clear()
+        _TREE_CACHE[cache_key] = result
+        return result
     
     except Exception as e:
         return f"Error building project structure: {str(e)}"
@@ -771,6 +984,7 @@ def get_project_structure(max_depth: int = 3, include_hidden: bool = False) -> s
             required=True,
         ),
     ],
+    is_io_bound=True,
 )
 def get_stock_price(symbol: str) -> str:
     """Get real-time stock price for a given symbol."""
@@ -823,6 +1037,7 @@ def get_stock_price(symbol: str) -> str:
             required=True,
         ),
     ],
+    is_io_bound=True,
 )
 def get_stock_overview(symbol: str) -> str:
     """Get company overview and fundamentals."""
@@ -859,7 +1074,7 @@ def get_stock_overview(symbol: str) -> str:
         output.append(f"  - 200-Day Moving Avg: ${data.get('200DayMovingAverage', 'N/A')}")
         output.append(f"\n**📝 Description:**")
         desc = data.get('Description', 'No description available.')
-        output.append(f"{desc[:500]}..." if len(desc) > 500 else desc)
+        output.append(_truncate(desc, 500))
         
         return "\n".join(output)
     
@@ -888,6 +1103,7 @@ def get_stock_overview(symbol: str) -> str:
             default="",
         ),
     ],
+    is_io_bound=True,
 )
 def get_market_news(tickers: str = "", topics: str = "") -> str:
     """Get market news and sentiment."""
@@ -926,7 +1142,7 @@ def get_market_news(tickers: str = "", topics: str = "") -> str:
             
             output.append(f"**{i}. {title}**")
             output.append(f"   Source: {source} | Sentiment: {sentiment}")
-            output.append(f"   {summary[:200]}..." if len(summary) > 200 else f"   {summary}")
+            output.append(f"   {_truncate(summary, 200)}")
             output.append(f"   [Read more]({url})\n")
         
         return "\n".join(output)
@@ -956,24 +1172,29 @@ def get_tool_descriptions() -> str:
     return "\n".join(lines)
 
 
-def execute_tool_call(tool_call: dict[str, Any]) -> str:
+def execute_tool_call(tool_call: Any) -> str:
     """
     Execute a tool call from LLM response.
-    
+
     Args:
-        tool_call: Dictionary with 'name' and 'arguments' keys
-    
+        tool_call: An llm_client.ToolCall, or a dictionary with 'name' and
+            'arguments' keys (duck-typed to avoid a circular import)
+
     Returns:
         The tool execution result
     """
-    name = tool_call.get("name", "")
-    arguments = tool_call.get("arguments", {})
+    if isinstance(tool_call, dict):
+        name = tool_call.get("name", "")
+        arguments = tool_call.get("arguments", {})
+    else:
+        name = tool_call.name
+        arguments = tool_call.arguments
     
     # Handle string arguments (JSON)
     if isinstance(arguments, str):
         try:
-            arguments = json.loads(arguments)
-        except json.JSONDecodeError:
+            arguments = _json_loads(arguments)
+        except ValueError:
             return f"Error: Invalid JSON arguments for tool '{name}'"
     
     return registry.execute(name, **arguments)
@@ -986,6 +1207,7 @@ def execute_tool_call(tool_call: dict[str, Any]) -> str:
 # Ensure all tools are registered by importing the module
 __all__ = [
     "registry",
+    "get_registry",
     "tool",
     "Tool",
     "ToolParameter",
@@ -1004,4 +1226,5 @@ __all__ = [
     "get_market_news",
     "get_tool_descriptions",
     "execute_tool_call",
+    "invalidate_config_cache",
 ]
@@ -7,7 +7,10 @@ from __future__ import annotations
 
 import asyncio
 import os
+import time
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -40,6 +43,28 @@ ROBOT_ASCII = """\
 █              █
 ████████████████"""
 
+# Pre-split once at import; consumers iterate the tuple
+ROBOT_ASCII_LINES = tuple(ROBOT_ASCII.splitlines())
+
+
+def _truncate(s: str, n: int) -> str:
+    """Clip ``s`` to ``n`` chars with an ellipsis marker; no-op when short."""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+def _short_repr(value: Any, limit: int = 80) -> str:
+    """repr clipped to ``limit`` chars, noting how much was elided.
+
+    Long strings are sliced before repr so displaying a huge file body as a
+    tool argument never pays for escaping the whole thing.
+    """
+    if isinstance(value, str) and len(value) > limit:
+        return f"{repr(value[:limit])}...<+{len(value) - limit} chars>"
+    r = repr(value)
+    if len(r) <= limit:
+        return r
+    return f"{r[:limit]}...<+{len(r) - limit} chars>"
+
 
 @dataclass
 class RecentActivity:
@@ -52,20 +77,22 @@ class RecentActivity:
 @dataclass
 class TUIState:
     """Manages the state of the TUI."""
-    recent_activities: list[RecentActivity] = field(default_factory=list)
+    # maxlen bounds the history; appendleft keeps newest-first in O(1)
+    recent_activities: deque[RecentActivity] = field(default_factory=lambda: deque(maxlen=5))
     is_thinking: bool = False
     current_model: str = ""
     token_usage: dict[str, int] = field(default_factory=dict)
-    
+    # Bumped on every change so renderers can skip rebuilding the activity column
+    activity_version: int = 0
+
     def add_activity(self, action: str, details: str = "") -> None:
         """Add a new activity to the recent list."""
-        self.recent_activities.insert(0, RecentActivity(
+        self.recent_activities.appendleft(RecentActivity(
             timestamp=datetime.now(),
             action=action,
             details=details,
         ))
-        # Keep only last 5 activities
-        self.recent_activities = self.recent_activities[:5]
+        self.activity_version += 1
 
 
 class GeminiCodeTUI:
@@ -80,14 +107,21 @@ class GeminiCodeTUI:
         self.config = config or get_config()
         self.console = Console(force_terminal=True, color_system="truecolor")
         self.state = TUIState(current_model=self.config.current_model)
-        
+        # Set by stop_thinking so show_thinking can wait instead of polling
+        self._thinking_done: asyncio.Event | None = None
+
         # Define styles based on theme
         self._setup_styles()
     
     def _setup_styles(self) -> None:
         """Set up custom styles based on theme configuration."""
-        theme = self.config.theme
-        
+        # Snapshot the theme so render methods skip the config attribute hop
+        # per call; rerun _setup_styles if the theme ever changes
+        theme = self._theme = self.config.theme
+        # Path objects re-stringify on every str(); cache the header copy and
+        # refresh it via refresh_cwd when the project root changes
+        self._cwd_str = str(self.config.project_root)
+
         self.styles = {
             "accent": Style(color=theme.accent_color, bold=False),
             "accent_bold": Style(color=theme.accent_color, bold=True),
@@ -99,41 +133,64 @@ class GeminiCodeTUI:
             "info": Style(color=theme.info_color),
             "border": Style(color=theme.accent_color),
         }
-    
+
+        # Header pieces that never change for the lifetime of the TUI are
+        # built once here instead of per render_header call
+        user_name = self.config.user_name
+        self._header_left_static: list[Text] = [
+            Text(f"Welcome back {user_name}!", style=self.styles["text"]),
+            Text(""),
+            *(Text(line, style=self.styles["accent"]) for line in ROBOT_ASCII_LINES),
+            Text(""),
+        ]
+
+        tip1 = Text("Run ", style=self.styles["text"])
+        tip1.append("/init", style=self.styles["accent"])
+        tip1.append(" to create a GEMINI.md file with instructions for Gemini", style=self.styles["text"])
+        tip2 = Text("Note: ", style=self.styles["dim"])
+        tip2.append("You have launched gemini in your home directory. For the best experience, launch it in a pro...", style=self.styles["dim"])
+        self._header_tips_static: list[Text] = [
+            Text("Tips for getting started", style=self.styles["accent_bold"]),
+            tip1,
+            tip2,
+            Text(""),
+            Text("Recent activity", style=self.styles["accent_bold"]),
+        ]
+
+        # Activity column cache: (activity_version, rendered lines)
+        self._activity_cache: tuple[int, list[Text]] | None = None
+
+    def refresh_cwd(self) -> None:
+        """Recompute the cached project-root string after it changes."""
+        self._cwd_str = str(self.config.project_root)
+
     def render_header(self) -> Panel:
         """
         Render the main header panel matching Claude Code layout.
         """
-        theme = self.config.theme
+        theme = self._theme
         user_name = self.config.user_name
-        cwd = str(self.config.project_root)
-        
+        cwd = self._cwd_str
+
         # Build the content as a table with two columns
         main_table = Table.grid(padding=(0, 2), expand=True)
         main_table.add_column(justify="center", ratio=1)  # Left: welcome + art
         main_table.add_column(justify="left", ratio=2)    # Right: tips + activity
         
         # === LEFT COLUMN ===
-        left_content = []
-        
-        # Welcome text
-        left_content.append(Text(f"Welcome back {user_name}!", style=self.styles["text"]))
-        left_content.append(Text(""))
-        
-        # ASCII art in orange
-        for line in ROBOT_ASCII.split("\n"):
-            left_content.append(Text(line, style=self.styles["accent"]))
-        
-        left_content.append(Text(""))
-        
+        # Welcome + ASCII art are prebuilt; only the model/org/path lines vary
+        left_content = list(self._header_left_static)
+
         # Model info
-        model_text = Text()
         model_name = self.config.current_model.replace("-", " ").replace(".", " ").title()
-        model_text.append(model_name, style=self.styles["text"])
-        model_text.append(" · ", style=self.styles["dim"])
-        model_text.append("API Usage Billing", style=self.styles["text"])
-        model_text.append(" · ", style=self.styles["dim"])
-        model_text.append(f"{user_name}'s", style=self.styles["text"])
+        # assemble builds the spans in one pass instead of five append calls
+        model_text = Text.assemble(
+            (model_name, self.styles["text"]),
+            (" · ", self.styles["dim"]),
+            ("API Usage Billing", self.styles["text"]),
+            (" · ", self.styles["dim"]),
+            (f"{user_name}'s", self.styles["text"]),
+        )
         left_content.append(model_text)
         
         # Org info
@@ -145,37 +202,26 @@ class GeminiCodeTUI:
         left_group = Group(*left_content)
         
         # === RIGHT COLUMN ===
-        right_content = []
-        
-        # Tips header
-        right_content.append(Text("Tips for getting started", style=self.styles["accent_bold"]))
-        
-        # Tips
-        tip1 = Text("Run ", style=self.styles["text"])
-        tip1.append("/init", style=self.styles["accent"])
-        tip1.append(" to create a GEMINI.md file with instructions for Gemini", style=self.styles["text"])
-        right_content.append(tip1)
-        
-        tip2 = Text("Note: ", style=self.styles["dim"])
-        tip2.append("You have launched gemini in your home directory. For the best experience, launch it in a pro...", style=self.styles["dim"])
-        right_content.append(tip2)
-        
-        right_content.append(Text(""))
-        
-        # Recent activity header
-        right_content.append(Text("Recent activity", style=self.styles["accent_bold"]))
-        
-        # Activity list
-        if not self.state.recent_activities:
-            right_content.append(Text("No recent activity", style=self.styles["dim"]))
-        else:
-            for activity in self.state.recent_activities[:3]:
-                activity_text = Text(activity.action, style=self.styles["text"])
-                if activity.details:
-                    activity_text.append(f" {activity.details}", style=self.styles["dim"])
-                right_content.append(activity_text)
-        
-        right_group = Group(*right_content)
+        # Tips are prebuilt; the activity lines rebuild only when they change
+        cache = self._activity_cache
+        if cache is None or cache[0] != self.state.activity_version:
+            if not self.state.recent_activities:
+                activity_lines = [Text("No recent activity", style=self.styles["dim"])]
+            else:
+                activity_lines = []
+                for activity in islice(self.state.recent_activities, 3):
+                    if activity.details:
+                        activity_text = Text.assemble(
+                            (activity.action, self.styles["text"]),
+                            (f" {activity.details}", self.styles["dim"]),
+                        )
+                    else:
+                        activity_text = Text(activity.action, style=self.styles["text"])
+                    activity_lines.append(activity_text)
+            cache = (self.state.activity_version, activity_lines)
+            self._activity_cache = cache
+
+        right_group = Group(*self._header_tips_static, *cache[1])
         
         # Add to table
         main_table.add_row(
@@ -218,7 +264,7 @@ class GeminiCodeTUI:
     
     def render_footer(self, notice: str = "") -> None:
         """Render the footer with shortcuts and notice."""
-        theme = self.config.theme
+        theme = self._theme
         
         # Create footer table
         footer_table = Table.grid(expand=True, padding=(0, 1))
@@ -245,7 +291,7 @@ class GeminiCodeTUI:
     
     def render_thinking_spinner(self) -> Progress:
         """Create a thinking spinner with orange dots."""
-        theme = self.config.theme
+        theme = self._theme
         
         progress = Progress(
             SpinnerColumn(
@@ -265,16 +311,20 @@ class GeminiCodeTUI:
     async def show_thinking(self, message: str = "Thinking...") -> None:
         """Display thinking indicator."""
         self.state.is_thinking = True
+        # Fresh event per session; waiting on it wakes the loop exactly once,
+        # when stop_thinking fires, instead of ten times a second
+        done = self._thinking_done = asyncio.Event()
         progress = self.render_thinking_spinner()
-        
+
         with progress:
             task = progress.add_task(message, total=None)
-            while self.state.is_thinking:
-                await asyncio.sleep(0.1)
-    
+            await done.wait()
+
     def stop_thinking(self) -> None:
         """Stop the thinking indicator."""
         self.state.is_thinking = False
+        if self._thinking_done is not None:
+            self._thinking_done.set()
     
     def render_message(
         self,
@@ -285,7 +335,7 @@ class GeminiCodeTUI:
         """
         Render a chat message with Markdown support.
         """
-        theme = self.config.theme
+        theme = self._theme
         
         # Determine styling based on role
         if role == "user":
@@ -326,7 +376,7 @@ class GeminiCodeTUI:
         title: str | None = None,
     ) -> None:
         """Render syntax-highlighted code."""
-        theme = self.config.theme
+        theme = self._theme
         
         syntax = Syntax(
             code,
@@ -353,24 +403,22 @@ class GeminiCodeTUI:
         result: str | None = None,
     ) -> None:
         """Render a tool call and its result."""
-        theme = self.config.theme
+        theme = self._theme
         
         # Tool call info
-        args_text = Text()
-        args_text.append(f"🔧 {tool_name}", style=self.styles["accent"])
-        args_text.append("(", style=self.styles["dim"])
-        
-        arg_parts = []
-        for key, value in arguments.items():
-            arg_parts.append(f"{key}={repr(value)}")
-        args_text.append(", ".join(arg_parts), style=self.styles["text"])
-        args_text.append(")", style=self.styles["dim"])
-        
+        arg_parts = [f"{key}={_short_repr(value)}" for key, value in arguments.items()]
+        args_text = Text.assemble(
+            (f"🔧 {tool_name}", self.styles["accent"]),
+            ("(", self.styles["dim"]),
+            (", ".join(arg_parts), self.styles["text"]),
+            (")", self.styles["dim"]),
+        )
+
         self.console.print(args_text)
         
         if result is not None:
             result_panel = Panel(
-                result[:500] + "..." if len(result) > 500 else result,
+                _truncate(result, 500),
                 border_style=theme.success_color,
                 title="Result",
                 title_align="left",
@@ -380,7 +428,7 @@ class GeminiCodeTUI:
     
     def render_error(self, message: str, title: str = "Error") -> None:
         """Render an error message."""
-        theme = self.config.theme
+        theme = self._theme
         
         error_panel = Panel(
             Text(message, style=self.styles["error"]),
@@ -394,7 +442,7 @@ class GeminiCodeTUI:
     
     def render_success(self, message: str, title: str = "Success") -> None:
         """Render a success message."""
-        theme = self.config.theme
+        theme = self._theme
         
         success_panel = Panel(
             Text(message, style=self.styles["success"]),
@@ -408,7 +456,7 @@ class GeminiCodeTUI:
     
     def render_info(self, message: str, title: str = "Info") -> None:
         """Render an info message."""
-        theme = self.config.theme
+        theme = self._theme
         
         info_panel = Panel(
             Text(message, style=self.styles["info"]),
@@ -431,23 +479,39 @@ class GeminiCodeTUI:
     async def stream_response(self, content_generator) -> str:
         """
         Stream a response to the console.
+
+        The whole document is re-parsed as Markdown on each update, which is
+        O(N^2) over a long reply if done per token - so updates are coalesced
+        to at most one reparse per 100 ms or 256-char burst.
         """
-        theme = self.config.theme
+        theme = self._theme
         full_content = ""
-        
+        pending_chars = 0
+        last_render = 0.0
+
+        def build_panel() -> Panel:
+            return Panel(
+                Markdown(full_content),
+                border_style=theme.accent_color,
+                title="🤖 Klix code",
+                title_align="left",
+                padding=(1, 2),
+            )
+
         with Live(console=self.console, refresh_per_second=10) as live:
             async for chunk in content_generator:
                 full_content += chunk
-                md = Markdown(full_content)
-                panel = Panel(
-                    md,
-                    border_style=theme.accent_color,
-                    title="🤖 Klix code",
-                    title_align="left",
-                    padding=(1, 2),
-                )
-                live.update(panel)
-        
+                pending_chars += len(chunk)
+
+                now = time.monotonic()
+                if pending_chars >= 256 or now - last_render >= 0.1:
+                    live.update(build_panel())
+                    last_render = now
+                    pending_chars = 0
+
+            if full_content:
+                live.update(build_panel())  # flush whatever the throttle held
+
         return full_content
 
 